@@ -1,8 +1,46 @@
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterator, Union
+from datetime import datetime, timedelta
 import logging
+import threading
+import time
+import warnings
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _select_sql(table_name: str, schema: Optional[str], columns: tuple,
+                where_template: Optional[str]) -> str:
+    """Build a SELECT statement, cached per table, schema, columns and filter."""
+    column_list = ', '.join(columns) if columns else '*'
+    table = f"{schema}.{table_name}" if schema else table_name
+    query = f"SELECT {column_list} FROM {table}"
+    
+    if where_template:
+        query += f" WHERE {where_template}"
+    
+    return query
+
+
+def _ns_to_datetime(timestamp_ns: Optional[int]) -> Optional[datetime]:
+    """Convert a ``time.time_ns()`` stamp to a local datetime."""
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
+
+
+@dataclass(slots=True)
+class ExtractionStats:
+    """Counters for one extraction run; timestamps are ``time.time_ns()`` stamps."""
+    start_ns: Optional[int] = None
+    end_ns: Optional[int] = None
+    rows_extracted: int = 0
+    tables_processed: int = 0
+    errors: deque = field(default_factory=lambda: deque(maxlen=1024))
+
 
 class BaseExtractor(ABC):
     """
@@ -10,6 +48,11 @@ class BaseExtractor(ABC):
     Defines the interface that all extractors must implement.
     """
     
+    __slots__ = ('config', 'logger', 'stats', '_stats_lock')
+    
+    # Configuration fields checked by validate_config
+    _REQUIRED_FIELDS = frozenset({'host', 'username', 'password'})
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the extractor with configuration.
@@ -19,13 +62,10 @@ class BaseExtractor(ABC):
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.extraction_stats = {
-            'start_time': None,
-            'end_time': None,
-            'rows_extracted': 0,
-            'tables_processed': 0,
-            'errors': []
-        }
+        self.stats = ExtractionStats(
+            errors=deque(maxlen=self.config.get('max_error_log', 1024))
+        )
+        self._stats_lock = threading.Lock()
     
     @abstractmethod
     def test_connection(self) -> bool:
@@ -40,15 +80,23 @@ class BaseExtractor(ABC):
     @abstractmethod
     def extract_table(self, table_name: str, schema: Optional[str] = None, 
                      where_clause: Optional[str] = None,
-                     columns: Optional[List[str]] = None) -> pd.DataFrame:
+                     columns: Optional[List[str]] = None,
+                     where_template: Optional[str] = None,
+                     where_binds: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """
         Extract data from a specific table.
         
+        Implementations must send filter values as bind parameters: build the
+        statement with ``_build_table_query`` and execute it with
+        ``where_binds``, never by formatting values into the SQL text.
+        
         Args:
             table_name: Name of the table to extract
             schema: Schema name (optional)
-            where_clause: WHERE clause for filtering (optional)
+            where_clause: Literal WHERE clause (deprecated, use where_template)
             columns: List of columns to extract (optional)
+            where_template: WHERE clause with bind variables, e.g. "id > :min_id" (optional)
+            where_binds: Values for the bind variables in where_template (optional)
             
         Returns:
             pd.DataFrame: Extracted data
@@ -56,16 +104,19 @@ class BaseExtractor(ABC):
         pass
     
     @abstractmethod
-    def extract_query(self, query: str, parameters: Optional[Dict] = None) -> pd.DataFrame:
+    def extract_query(self, query: str, parameters: Optional[Dict] = None,
+                     return_format: str = 'pandas') -> Union[pd.DataFrame, Iterator[Any]]:
         """
         Extract data using a custom SQL query.
         
         Args:
             query: SQL query to execute
             parameters: Query parameters (optional)
+            return_format: 'pandas' for a DataFrame, or 'arrow' for an
+                iterator of pyarrow RecordBatches (optional)
             
         Returns:
-            pd.DataFrame: Query results
+            Union[pd.DataFrame, Iterator[pa.RecordBatch]]: Query results
         """
         pass
     
@@ -96,6 +147,23 @@ class BaseExtractor(ABC):
         """
         pass
     
+    def extract_query_batches(self, query: str, parameters: Optional[Dict] = None,
+                              batch_size: int = 50000) -> Iterator[pd.DataFrame]:
+        """
+        Extract data using a custom SQL query, yielding it in batches.
+        Default implementation yields the full result of extract_query;
+        subclasses should override it to stream from the cursor.
+        
+        Args:
+            query: SQL query to execute
+            parameters: Query parameters (optional)
+            batch_size: Maximum number of rows per batch
+            
+        Yields:
+            pd.DataFrame: Batches of query results
+        """
+        yield self.extract_query(query, parameters)
+    
     def extract_incremental(self, table_name: str, 
                           timestamp_column: str,
                           last_extract_time: datetime,
@@ -103,7 +171,7 @@ class BaseExtractor(ABC):
                           columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Extract incremental data based on timestamp.
-        Default implementation using WHERE clause.
+        Default implementation using a bound timestamp parameter.
         
         Args:
             table_name: Name of the table to extract
@@ -115,61 +183,151 @@ class BaseExtractor(ABC):
         Returns:
             pd.DataFrame: Incremental data
         """
-        formatted_time = last_extract_time.strftime('%Y-%m-%d %H:%M:%S')
-        where_clause = f"{timestamp_column} > '{formatted_time}'"
+        query = self._build_incremental_query(table_name, timestamp_column, schema, columns)
+        
+        return self.extract_query(query, self._incremental_parameters(last_extract_time))
+    
+    def extract_incremental_batches(self, table_name: str,
+                                  timestamp_column: str,
+                                  last_extract_time: datetime,
+                                  schema: Optional[str] = None,
+                                  columns: Optional[List[str]] = None,
+                                  batch_size: int = 50000) -> Iterator[pd.DataFrame]:
+        """
+        Extract incremental data based on timestamp, yielding it in batches.
+        
+        Args:
+            table_name: Name of the table to extract
+            timestamp_column: Column to use for incremental extraction
+            last_extract_time: Last extraction timestamp
+            schema: Schema name (optional)
+            columns: List of columns to extract (optional)
+            batch_size: Maximum number of rows per batch
+            
+        Yields:
+            pd.DataFrame: Batches of incremental data
+        """
+        query = self._build_incremental_query(table_name, timestamp_column, schema, columns)
+        
+        yield from self.extract_query_batches(
+            query,
+            self._incremental_parameters(last_extract_time),
+            batch_size=batch_size
+        )
+    
+    def _build_table_query(self, table_name: str, schema: Optional[str] = None,
+                           columns: Optional[List[str]] = None,
+                           where_template: Optional[str] = None,
+                           where_clause: Optional[str] = None) -> str:
+        """
+        Build a SELECT statement for a table.
+        
+        Args:
+            table_name: Name of the table
+            schema: Schema name (optional)
+            columns: List of columns to select (optional)
+            where_template: WHERE clause with bind variables (optional)
+            where_clause: Literal WHERE clause (deprecated, optional)
+            
+        Returns:
+            str: SQL statement
+        """
+        if where_clause and not where_template:
+            warnings.warn(
+                "where_clause is deprecated; pass where_template with where_binds instead",
+                DeprecationWarning,
+                stacklevel=3
+            )
+            where_template = where_clause
         
-        return self.extract_table(
-            table_name=table_name,
+        return _select_sql(table_name, schema, tuple(columns) if columns else (), where_template)
+    
+    def _build_incremental_query(self, table_name: str, timestamp_column: str,
+                                 schema: Optional[str] = None,
+                                 columns: Optional[List[str]] = None) -> str:
+        """Build the incremental extraction query with a :last_ts bind variable."""
+        return self._build_table_query(
+            table_name,
             schema=schema,
-            where_clause=where_clause,
-            columns=columns
+            columns=columns,
+            where_template=f"{timestamp_column} > :last_ts"
         )
     
+    def _incremental_parameters(self, last_extract_time: datetime) -> Dict[str, Any]:
+        """
+        Build the bind parameters for an incremental extraction.
+        
+        The high-water mark is moved back by ``incremental_lag_seconds`` so rows
+        committed late with an older timestamp are not missed.
+        """
+        lag_seconds = self.config.get('incremental_lag_seconds', 0)
+        
+        return {'last_ts': last_extract_time - timedelta(seconds=lag_seconds)}
+    
     def start_extraction(self):
         """Mark the start of extraction process."""
-        self.extraction_stats['start_time'] = datetime.now()
-        self.extraction_stats['rows_extracted'] = 0
-        self.extraction_stats['tables_processed'] = 0
-        self.extraction_stats['errors'] = []
+        with self._stats_lock:
+            start_ns = self.stats.start_ns = time.time_ns()
+            self.stats.end_ns = None
+            self.stats.rows_extracted = 0
+            self.stats.tables_processed = 0
+            self.stats.errors.clear()
         
-        self.logger.info(f"Starting extraction process at {self.extraction_stats['start_time']}")
+        self.logger.info("Starting extraction process at %s", _ns_to_datetime(start_ns))
     
     def end_extraction(self):
         """Mark the end of extraction process."""
-        self.extraction_stats['end_time'] = datetime.now()
+        with self._stats_lock:
+            start_ns = self.stats.start_ns
+            end_ns = self.stats.end_ns = time.time_ns()
+            tables_processed = self.stats.tables_processed
+            rows_extracted = self.stats.rows_extracted
+            error_count = len(self.stats.errors)
         
-        duration = self.extraction_stats['end_time'] - self.extraction_stats['start_time']
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Extraction completed at %s", _ns_to_datetime(end_ns))
+            if start_ns is not None:
+                self.logger.info("Total duration: %s",
+                                 timedelta(microseconds=(end_ns - start_ns) // 1000))
+            self.logger.info("Tables processed: %s", tables_processed)
+            self.logger.info("Rows extracted: %s", rows_extracted)
         
-        self.logger.info(f"Extraction completed at {self.extraction_stats['end_time']}")
-        self.logger.info(f"Total duration: {duration}")
-        self.logger.info(f"Tables processed: {self.extraction_stats['tables_processed']}")
-        self.logger.info(f"Rows extracted: {self.extraction_stats['rows_extracted']}")
-        
-        if self.extraction_stats['errors']:
-            self.logger.warning(f"Errors encountered: {len(self.extraction_stats['errors'])}")
+        if error_count:
+            self.logger.warning("Errors encountered: %s", error_count)
     
     def add_extraction_stats(self, rows: int, tables: int = 1):
         """
         Add to extraction statistics.
         
+        Safe to call from several extraction threads at once.
+        
         Args:
             rows: Number of rows extracted
             tables: Number of tables processed (default: 1)
         """
-        self.extraction_stats['rows_extracted'] += rows
-        self.extraction_stats['tables_processed'] += tables
+        with self._stats_lock:
+            self.stats.rows_extracted += rows
+            self.stats.tables_processed += tables
     
     def add_error(self, error: str):
         """
         Add an error to the extraction statistics.
+        Only the most recent ``max_error_log`` errors are kept.
         
         Args:
             error: Error message
         """
-        self.extraction_stats['errors'].append({
-            'timestamp': datetime.now(),
-            'error': error
-        })
+        with self._stats_lock:
+            self.stats.errors.append((time.time_ns(), error))
+    
+    @property
+    def extraction_stats(self) -> Dict[str, Any]:
+        """
+        Extraction statistics in the original dict layout, kept for existing
+        callers. Read-only: this is a snapshot of ``stats``, so update the
+        counters through ``add_extraction_stats`` and ``add_error``.
+        """
+        return self.get_extraction_stats()
     
     def get_extraction_stats(self) -> Dict[str, Any]:
         """
@@ -178,7 +336,23 @@ class BaseExtractor(ABC):
         Returns:
             Dict: Extraction statistics
         """
-        return self.extraction_stats.copy()
+        with self._stats_lock:
+            start_ns = self.stats.start_ns
+            end_ns = self.stats.end_ns
+            rows_extracted = self.stats.rows_extracted
+            tables_processed = self.stats.tables_processed
+            errors = list(self.stats.errors)
+        
+        return {
+            'start_time': _ns_to_datetime(start_ns),
+            'end_time': _ns_to_datetime(end_ns),
+            'rows_extracted': rows_extracted,
+            'tables_processed': tables_processed,
+            'errors': [
+                {'timestamp': _ns_to_datetime(timestamp_ns), 'error': error}
+                for timestamp_ns, error in errors
+            ]
+        }
     
     def validate_config(self) -> bool:
         """
@@ -191,13 +365,11 @@ class BaseExtractor(ABC):
             self.logger.error("Configuration is empty")
             return False
         
-        # Basic validation - can be overridden in subclasses
-        required_fields = ['host', 'username', 'password']
-        
-        for field in required_fields:
-            if field not in self.config:
-                self.logger.error(f"Missing required configuration field: {field}")
-                return False
+        # Basic validation - subclasses can override _REQUIRED_FIELDS
+        missing = self._REQUIRED_FIELDS - self.config.keys()
+        if missing:
+            self.logger.error("Missing required configuration fields: %s", ', '.join(sorted(missing)))
+            return False
         
         return True
     
@@ -4,11 +4,15 @@ import oracledb
 import sqlalchemy
 from sqlalchemy import create_engine, pool
 import pandas as pd
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, Iterator, Callable
 import logging
 from pathlib import Path
 import sys
-from contextlib import contextmanager
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from functools import lru_cache
+import queue
 import threading
 import time
 
@@ -16,9 +20,44 @@ import time
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.exception import ETLException
-from src.util.logger import get_logger
+from src.util.logger import ETLLogger
 from src.util.encryption_util import decrypt_password
 
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Rows fetched per round-trip for result sets
+DEFAULT_ARRAYSIZE = 10000
+
+# Database version, instance and session details in one round trip
+_CONNECTION_INFO_SQL = """
+    SELECT v.banner,
+           i.instance_name,
+           i.host_name,
+           SYS_CONTEXT('USERENV', 'SESSION_USER') as username,
+           SYS_CONTEXT('USERENV', 'SERVER_HOST') as server_host,
+           SYS_CONTEXT('USERENV', 'DB_NAME') as db_name
+    FROM (SELECT banner FROM V$VERSION WHERE ROWNUM = 1) v
+    CROSS JOIN V$INSTANCE i
+"""
+_CONNECTION_INFO_FIELDS = (
+    'database_version', 'instance_name', 'host_name',
+    'username', 'server_host', 'database_name'
+)
+
+
+@lru_cache(maxsize=64)
+def _make_dsn(host: str, port: int, service_name: Optional[str], sid: Optional[str]) -> str:
+    """Build an Oracle DSN string, cached per address."""
+    if service_name:
+        return oracledb.makedsn(host, port, service_name=service_name)
+    elif sid:
+        return oracledb.makedsn(host, port, sid=sid)
+    else:
+        raise ETLException("Either service_name or sid must be provided")
+
 
 class ConnectionManager:
     """
@@ -27,10 +66,15 @@ class ConnectionManager:
     """
     
     def __init__(self):
-        self.logger = get_logger(__name__)
+        self.logger = ETLLogger.get_logger(__name__)
         self._connections = {}
+        # Pool each checked-out connection came from, by connection name
+        self._connection_pools = {}
         self._pools = {}
-        self._lock = threading.Lock()
+        self._engines = {}
+        self._passwords = {}
+        self._lock = threading.RLock()
+        self._name_locks = defaultdict(threading.Lock)
     
     def create_oracle_connection(self, config: Dict[str, Any]) -> oracledb.Connection:
         """
@@ -45,63 +89,42 @@ class ConnectionManager:
         try:
             host = config.get('host')
             port = config.get('port', 1521)
-            service_name = config.get('service_name')
-            sid = config.get('sid')
             username = config.get('username')
-            password = config.get('password')
             
             # Decrypt password if encrypted
-            if config.get('password_encrypted', False):
-                password = decrypt_password(password)
+            password = self._resolve_password(config)
             
             # Create DSN
-            if service_name:
-                dsn = oracledb.makedsn(host, port, service_name=service_name)
-            elif sid:
-                dsn = oracledb.makedsn(host, port, sid=sid)
-            else:
-                raise ETLException("Either service_name or sid must be provided")
+            dsn = self._resolve_dsn(config)
             
             # Set Oracle client configuration
-            if config.get('thick_mode', False):
-                try:
-                    oracledb.init_oracle_client()
-                except Exception as e:
-                    self.logger.warning(f"Failed to initialize Oracle thick client: {e}")
+            self._init_client_mode(config)
             
             # Create connection
             connection = oracledb.connect(
                 user=username,
                 password=password,
-                dsn=dsn,
-                encoding='UTF-8'
+                dsn=dsn
             )
             
-            # Set session parameters
-            cursor = connection.cursor()
-            
-            # Set session timezone if specified
-            if config.get('timezone'):
-                cursor.execute(f"ALTER SESSION SET TIME_ZONE = '{config['timezone']}'")
-            
-            # Set NLS parameters
-            nls_params = config.get('nls_parameters', {})
-            for param, value in nls_params.items():
-                cursor.execute(f"ALTER SESSION SET {param} = '{value}'")
-            
-            cursor.close()
+            # Set session parameters in a single round-trip
+            session_sql = self._session_setup_sql(config)
+            if session_sql:
+                cursor = connection.cursor()
+                cursor.execute(session_sql)
+                cursor.close()
             
-            self.logger.info(f"Oracle connection established successfully to {host}:{port}")
+            self.logger.info("Oracle connection established successfully to %s:%s", host, port)
             return connection
             
         except oracledb.DatabaseError as e:
-            self.logger.error(f"Failed to create Oracle connection: {str(e)}")
+            self.logger.error("Failed to create Oracle connection: %s", e)
             raise ETLException(f"Oracle connection failed: {str(e)}")
         except Exception as e:
-            self.logger.error(f"Unexpected error creating Oracle connection: {str(e)}")
+            self.logger.error("Unexpected error creating Oracle connection: %s", e)
             raise ETLException(f"Connection creation failed: {str(e)}")
     
-    def create_oracle_pool(self, config: Dict[str, Any]) -> oracledb.SessionPool:
+    def create_oracle_pool(self, config: Dict[str, Any]) -> oracledb.ConnectionPool:
         """
         Create Oracle connection pool.
         
@@ -109,15 +132,10 @@ class ConnectionManager:
             config: Oracle configuration dictionary
             
         Returns:
-            oracledb.SessionPool: Oracle connection pool
+            oracledb.ConnectionPool: Oracle connection pool
         """
         try:
-            host = config.get('host')
-            port = config.get('port', 1521)
-            service_name = config.get('service_name')
-            sid = config.get('sid')
             username = config.get('username')
-            password = config.get('password')
             
             # Pool configuration
             min_connections = config.get('pool_min', 1)
@@ -125,42 +143,45 @@ class ConnectionManager:
             increment = config.get('pool_increment', 1)
             
             # Decrypt password if encrypted
-            if config.get('password_encrypted', False):
-                password = decrypt_password(password)
+            password = self._resolve_password(config)
             
             # Create DSN
-            if service_name:
-                dsn = oracledb.makedsn(host, port, service_name=service_name)
-            elif sid:
-                dsn = oracledb.makedsn(host, port, sid=sid)
-            else:
-                raise ETLException("Either service_name or sid must be provided")
+            dsn = self._resolve_dsn(config)
+            
+            # Set Oracle client configuration
+            self._init_client_mode(config)
             
             # Create connection pool
-            pool = oracledb.SessionPool(
+            pool = oracledb.create_pool(
                 user=username,
                 password=password,
                 dsn=dsn,
                 min=min_connections,
                 max=max_connections,
                 increment=increment,
-                threaded=True,
-                getmode=oracledb.SPOOL_ATTRVAL_WAIT,
+                getmode=oracledb.POOL_GETMODE_WAIT,
+                homogeneous=True,
                 timeout=config.get('pool_timeout', 3600),
-                encoding='UTF-8'
+                stmtcachesize=config.get('stmt_cache_size', 200),
+                ping_interval=config.get('ping_interval', 60),
+                events=config.get('use_fan', False),
+                session_callback=self._make_session_callback(config)
             )
             
-            self.logger.info(f"Oracle connection pool created: {min_connections}-{max_connections} connections")
+            self.logger.info("Oracle connection pool created: %s-%s connections", min_connections, max_connections)
             return pool
             
         except oracledb.DatabaseError as e:
-            self.logger.error(f"Failed to create Oracle connection pool: {str(e)}")
+            self.logger.error("Failed to create Oracle connection pool: %s", e)
             raise ETLException(f"Oracle pool creation failed: {str(e)}")
     
     def create_sqlalchemy_engine(self, config: Dict[str, Any]) -> sqlalchemy.Engine:
         """
         Create SQLAlchemy engine for Oracle.
         
+        Engines are cached per connection URL, so repeated calls for the same
+        database share one engine and its connection pool.
+        
         Args:
             config: Oracle configuration dictionary
             
@@ -173,11 +194,9 @@ class ConnectionManager:
             service_name = config.get('service_name')
             sid = config.get('sid')
             username = config.get('username')
-            password = config.get('password')
             
             # Decrypt password if encrypted
-            if config.get('password_encrypted', False):
-                password = decrypt_password(password)
+            password = self._resolve_password(config)
             
             # Build connection URL
             if service_name:
@@ -193,25 +212,49 @@ class ConnectionManager:
                 'max_overflow': config.get('max_overflow', 20),
                 'pool_timeout': config.get('pool_timeout', 30),
                 'pool_recycle': config.get('pool_recycle', 3600),
+                'pool_pre_ping': config.get('pool_pre_ping', True),
                 'echo': config.get('echo', False)
             }
             
-            engine = create_engine(url, **engine_config)
+            engine = self._engines.get(url)
+            if engine is not None:
+                return engine
             
-            # Test connection
-            with engine.connect() as conn:
-                conn.execute(sqlalchemy.text("SELECT 1 FROM DUAL"))
+            # Build and probe under a per-URL lock so a slow or unreachable
+            # database does not hold up the manager-wide lock
+            with self._name_lock(('engine', url)):
+                engine = self._engines.get(url)
+                if engine is not None:
+                    return engine
+                
+                engine = create_engine(url, **engine_config)
+                
+                # Test connection
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(sqlalchemy.text("SELECT 1 FROM DUAL"))
+                except Exception:
+                    engine.dispose()
+                    raise
+                
+                with self._lock:
+                    self._engines[url] = engine
             
             self.logger.info("SQLAlchemy Oracle engine created successfully")
             return engine
             
         except Exception as e:
-            self.logger.error(f"Failed to create SQLAlchemy engine: {str(e)}")
+            self.logger.error("Failed to create SQLAlchemy engine: %s", e)
             raise ETLException(f"SQLAlchemy engine creation failed: {str(e)}")
     
     def get_connection(self, connection_name: str, config: Dict[str, Any]) -> oracledb.Connection:
         """
-        Get a named connection, creating it if it doesn't exist.
+        Get a named connection, acquiring it from the pool for its DSN if it doesn't exist.
+        
+        Pools are keyed by user, host, port and service, so every name
+        pointing at the same database shares one pool. The session stays
+        checked out under ``connection_name`` until it is handed back with
+        ``release`` or ``close_connection``.
         
         Args:
             connection_name: Name to identify the connection
@@ -220,13 +263,47 @@ class ConnectionManager:
         Returns:
             oracledb.Connection: Database connection
         """
-        with self._lock:
-            if connection_name not in self._connections:
-                self._connections[connection_name] = self.create_oracle_connection(config)
+        connection = self._connections.get(connection_name)
+        if connection is not None:
+            return connection
+        
+        pool = self.get_pool(self._pool_name(config), config)
+        
+        with self._name_lock(connection_name):
+            connection = self._connections.get(connection_name)
+            if connection is None:
+                connection = pool.acquire()
+                with self._lock:
+                    self._connection_pools[connection_name] = pool
+                    self._connections[connection_name] = connection
             
-            return self._connections[connection_name]
+            return connection
     
-    def get_pool(self, pool_name: str, config: Dict[str, Any]) -> oracledb.SessionPool:
+    def release(self, connection: oracledb.Connection):
+        """
+        Return a connection obtained from ``get_connection`` to its pool.
+        
+        Args:
+            connection: Connection to release
+        """
+        pool = None
+        with self._lock:
+            for name, conn in list(self._connections.items()):
+                if conn is connection:
+                    del self._connections[name]
+                    pool = self._connection_pools.pop(name, None)
+                    break
+        
+        try:
+            if pool is not None:
+                pool.release(connection)
+            else:
+                # Closing a pooled connection hands it back to its pool
+                connection.close()
+        except Exception as e:
+            self.logger.warning("Error releasing connection: %s", e)
+    
+    def get_pool(self, pool_name: str, config: Dict[str, Any]) -> oracledb.ConnectionPool:
         """
         Get a named connection pool, creating it if it doesn't exist.
         
@@ -235,13 +312,19 @@ class ConnectionManager:
             config: Pool configuration
             
         Returns:
-            oracledb.SessionPool: Connection pool
+            oracledb.ConnectionPool: Connection pool
         """
-        with self._lock:
-            if pool_name not in self._pools:
-                self._pools[pool_name] = self.create_oracle_pool(config)
+        pool = self._pools.get(pool_name)
+        if pool is not None:
+            return pool
+        
+        with self._name_lock(pool_name):
+            pool = self._pools.get(pool_name)
+            if pool is None:
+                pool = self.create_oracle_pool(config)
+                self._pools[pool_name] = pool
             
-            return self._pools[pool_name]
+            return pool
     
     @contextmanager
     def get_pooled_connection(self, pool_name: str, config: Dict[str, Any]):
@@ -267,19 +350,22 @@ class ConnectionManager:
                     connection.rollback()
                 except:
                     pass
-            self.logger.error(f"Error in pooled connection: {str(e)}")
+            self.logger.error("Error in pooled connection: %s", e)
             raise
         finally:
             if connection:
                 try:
                     pool.release(connection)
                 except Exception as e:
-                    self.logger.warning(f"Error releasing connection to pool: {str(e)}")
+                    self.logger.warning("Error releasing connection to pool: %s", e)
     
     def test_connection(self, config: Dict[str, Any], retry_count: int = 3) -> bool:
         """
         Test database connection with retry logic.
         
+        Each attempt pings a session from the pool for this configuration,
+        which is a single round-trip once the pool is warm.
+        
         Args:
             config: Connection configuration
             retry_count: Number of retry attempts
@@ -287,20 +373,19 @@ class ConnectionManager:
         Returns:
             bool: True if connection successful
         """
+        pool_name = self._pool_name(config)
+        
         for attempt in range(retry_count):
             try:
-                connection = self.create_oracle_connection(config)
-                cursor = connection.cursor()
-                cursor.execute("SELECT 1 FROM DUAL")
-                result = cursor.fetchone()
-                cursor.close()
-                connection.close()
+                pool = self.get_pool(pool_name, config)
+                with closing(pool.acquire()) as connection:
+                    connection.ping()
                 
                 self.logger.info("Connection test successful")
                 return True
                 
             except Exception as e:
-                self.logger.warning(f"Connection test attempt {attempt + 1} failed: {str(e)}")
+                self.logger.warning("Connection test attempt %s failed: %s", attempt + 1, e)
                 if attempt < retry_count - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
@@ -310,19 +395,29 @@ class ConnectionManager:
         return False
     
     def execute_query(self, connection: oracledb.Connection, query: str, 
-                     parameters: Optional[Dict] = None) -> pd.DataFrame:
+                     parameters: Optional[Dict] = None,
+                     arraysize: int = DEFAULT_ARRAYSIZE) -> pd.DataFrame:
         """
         Execute a query and return results as DataFrame.
         
+        Rows are fetched as Arrow columns when pyarrow is installed, falling
+        back to pandas.read_sql_query otherwise.
+        
         Args:
             connection: Database connection
             query: SQL query to execute
             parameters: Query parameters (optional)
+            arraysize: Number of rows fetched per round-trip
             
         Returns:
             pd.DataFrame: Query results
         """
         try:
+            if pa is not None and hasattr(connection, 'fetch_df_all'):
+                odf = connection.fetch_df_all(query, parameters, arraysize=arraysize)
+                table = pa.Table.from_arrays(odf.column_arrays(), names=odf.column_names())
+                return table.to_pandas()
+            
             if parameters:
                 df = pd.read_sql_query(query, connection, params=parameters)
             else:
@@ -331,9 +426,133 @@ class ConnectionManager:
             return df
             
         except Exception as e:
-            self.logger.error(f"Query execution failed: {str(e)}")
+            self.logger.error("Query execution failed: %s", e)
+            raise ETLException(f"Query execution failed: {str(e)}")
+    
+    def execute_query_batches(self, connection: oracledb.Connection, query: str,
+                              parameters: Optional[Dict] = None,
+                              batch_size: int = DEFAULT_ARRAYSIZE) -> Iterator[pd.DataFrame]:
+        """
+        Execute a query and yield results as DataFrames of at most batch_size rows.
+        
+        Args:
+            connection: Database connection
+            query: SQL query to execute
+            parameters: Query parameters (optional)
+            batch_size: Maximum number of rows per batch
+            
+        Yields:
+            pd.DataFrame: Batches of query results
+        """
+        try:
+            if pa is not None and hasattr(connection, 'fetch_df_batches'):
+                for odf in connection.fetch_df_batches(query, parameters, size=batch_size):
+                    table = pa.Table.from_arrays(odf.column_arrays(), names=odf.column_names())
+                    yield table.to_pandas()
+                return
+            
+            yield from pd.read_sql_query(query, connection, params=parameters, chunksize=batch_size)
+            
+        except Exception as e:
+            self.logger.error("Query execution failed: %s", e)
+            raise ETLException(f"Query execution failed: {str(e)}")
+    
+    def execute_query_arrow(self, connection: oracledb.Connection, query: str,
+                            parameters: Optional[Dict] = None,
+                            batch_size: int = 50000) -> Iterator["pa.RecordBatch"]:
+        """
+        Execute a query and yield results as pyarrow RecordBatches.
+        
+        Batches go straight from the driver's Arrow buffers to the caller
+        without building a pandas DataFrame.
+        
+        Args:
+            connection: Database connection
+            query: SQL query to execute
+            parameters: Query parameters (optional)
+            batch_size: Maximum number of rows per batch
+            
+        Yields:
+            pa.RecordBatch: Batches of query results
+        """
+        if pa is None:
+            raise ETLException("pyarrow is required for Arrow query results")
+        
+        try:
+            if hasattr(connection, 'fetch_df_batches'):
+                for odf in connection.fetch_df_batches(query, parameters, size=batch_size):
+                    yield pa.RecordBatch.from_arrays(odf.column_arrays(), names=odf.column_names())
+                return
+            
+            for df in pd.read_sql_query(query, connection, params=parameters, chunksize=batch_size):
+                yield pa.RecordBatch.from_pandas(df, preserve_index=False)
+            
+        except Exception as e:
+            self.logger.error("Query execution failed: %s", e)
             raise ETLException(f"Query execution failed: {str(e)}")
     
+    def stream_query(self, connection: oracledb.Connection, query: str,
+                     sink: Callable[["pa.RecordBatch"], Any],
+                     parameters: Optional[Dict] = None,
+                     batch_size: int = 50000) -> int:
+        """
+        Execute a query and pass each RecordBatch to a sink while the next one is fetched.
+        
+        A background thread fetches batches into a small queue, so network
+        fetches overlap with the sink's work (e.g. ``ParquetWriter.write_batch``).
+        
+        Args:
+            connection: Database connection
+            query: SQL query to execute
+            sink: Callable invoked with each pyarrow RecordBatch
+            parameters: Query parameters (optional)
+            batch_size: Maximum number of rows per batch
+            
+        Returns:
+            int: Total number of rows passed to the sink
+        """
+        batches = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        done = object()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            try:
+                for batch in self.execute_query_arrow(connection, query, parameters, batch_size):
+                    if not put(batch):
+                        return
+                put(done)
+            except Exception as e:
+                put(e)
+        
+        producer = threading.Thread(target=produce, name="stream-query-fetch", daemon=True)
+        producer.start()
+        
+        rows = 0
+        try:
+            while True:
+                item = batches.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                
+                sink(item)
+                rows += item.num_rows
+        finally:
+            stop.set()
+            producer.join()
+        
+        return rows
+    
     def execute_ddl(self, connection: oracledb.Connection, ddl: str) -> bool:
         """
         Execute DDL statement.
@@ -345,28 +564,27 @@ class ConnectionManager:
         Returns:
             bool: True if successful
         """
-        cursor = None
         try:
-            cursor = connection.cursor()
-            cursor.execute(ddl)
+            with closing(connection.cursor()) as cursor:
+                cursor.execute(ddl)
             connection.commit()
             
             self.logger.info("DDL executed successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"DDL execution failed: {str(e)}")
+            self.logger.error("DDL execution failed: %s", e)
             if connection:
                 connection.rollback()
             raise ETLException(f"DDL execution failed: {str(e)}")
-        finally:
-            if cursor:
-                cursor.close()
     
     def get_connection_info(self, connection: oracledb.Connection) -> Dict[str, Any]:
         """
         Get connection information.
         
+        The details are fetched with a single query. They are not cached:
+        instance and host differ per session on RAC or SCAN services.
+        
         Args:
             connection: Database connection
             
@@ -374,38 +592,16 @@ class ConnectionManager:
             Dict: Connection information
         """
         try:
-            cursor = connection.cursor()
-            
-            # Get database version
-            cursor.execute("SELECT * FROM V$VERSION WHERE ROWNUM = 1")
-            version_info = cursor.fetchone()
-            
-            # Get instance info
-            cursor.execute("SELECT INSTANCE_NAME, HOST_NAME FROM V$INSTANCE")
-            instance_info = cursor.fetchone()
-            
-            # Get session info
-            cursor.execute("""
-                SELECT SYS_CONTEXT('USERENV', 'SESSION_USER') as username,
-                       SYS_CONTEXT('USERENV', 'SERVER_HOST') as server_host,
-                       SYS_CONTEXT('USERENV', 'DB_NAME') as db_name
-                FROM DUAL
-            """)
-            session_info = cursor.fetchone()
-            
-            cursor.close()
-            
-            return {
-                'database_version': version_info[0] if version_info else 'Unknown',
-                'instance_name': instance_info[0] if instance_info else 'Unknown',
-                'host_name': instance_info[1] if instance_info else 'Unknown',
-                'username': session_info[0] if session_info else 'Unknown',
-                'server_host': session_info[1] if session_info else 'Unknown',
-                'database_name': session_info[2] if session_info else 'Unknown'
-            }
+            with closing(connection.cursor()) as cursor:
+                cursor.execute(_CONNECTION_INFO_SQL)
+                row = cursor.fetchone()
+            
+            if row:
+                return dict(zip(_CONNECTION_INFO_FIELDS, row))
+            return dict.fromkeys(_CONNECTION_INFO_FIELDS, 'Unknown')
             
         except Exception as e:
-            self.logger.warning(f"Failed to get connection info: {str(e)}")
+            self.logger.warning("Failed to get connection info: %s", e)
             return {}
     
     def close_connection(self, connection_name: str):
@@ -415,51 +611,185 @@ class ConnectionManager:
         Args:
             connection_name: Name of the connection to close
         """
-        with self._lock:
-            if connection_name in self._connections:
-                try:
-                    self._connections[connection_name].close()
-                    del self._connections[connection_name]
-                    self.logger.info(f"Connection '{connection_name}' closed")
-                except Exception as e:
-                    self.logger.warning(f"Error closing connection '{connection_name}': {str(e)}")
+        connection = self._connections.get(connection_name)
+        if connection is not None:
+            self.release(connection)
+            self.logger.info("Connection '%s' closed", connection_name)
     
     def close_pool(self, pool_name: str):
         """
         Close a named connection pool.
         
+        Named connections checked out of the pool are released first.
+        
         Args:
             pool_name: Name of the pool to close
         """
         with self._lock:
-            if pool_name in self._pools:
-                try:
-                    self._pools[pool_name].close()
-                    del self._pools[pool_name]
-                    self.logger.info(f"Connection pool '{pool_name}' closed")
-                except Exception as e:
-                    self.logger.warning(f"Error closing pool '{pool_name}': {str(e)}")
+            pool = self._pools.get(pool_name)
+            if pool is None:
+                return
+            
+            checked_out = [
+                self._connections[name]
+                for name, owner in self._connection_pools.items() if owner is pool
+            ]
+        
+        for connection in checked_out:
+            self.release(connection)
+        
+        with self._lock:
+            try:
+                pool.close()
+                self._pools.pop(pool_name, None)
+                self.logger.info("Connection pool '%s' closed", pool_name)
+            except Exception as e:
+                self.logger.warning("Error closing pool '%s': %s", pool_name, e)
     
     def close_all(self):
-        """Close all connections and pools."""
+        """
+        Close all connections, pools and engines.
+        
+        The registries are emptied under the lock; the network round-trips
+        to return connections then run concurrently outside of it.
+        """
         with self._lock:
-            # Close all connections
-            for name, connection in list(self._connections.items()):
-                try:
-                    connection.close()
-                    self.logger.info(f"Connection '{name}' closed")
-                except Exception as e:
-                    self.logger.warning(f"Error closing connection '{name}': {str(e)}")
-            
-            # Close all pools
-            for name, pool in list(self._pools.items()):
-                try:
-                    pool.close()
-                    self.logger.info(f"Pool '{name}' closed")
-                except Exception as e:
-                    self.logger.warning(f"Error closing pool '{name}': {str(e)}")
+            connections = [
+                (name, connection, self._connection_pools.get(name))
+                for name, connection in self._connections.items()
+            ]
+            pools = dict(self._pools)
+            engines = list(self._engines.values())
             
             self._connections.clear()
+            self._connection_pools.clear()
             self._pools.clear()
+            self._engines.clear()
+            self._passwords.clear()
+        
+        def release_connection(item):
+            name, connection, pool = item
+            try:
+                if pool is not None:
+                    pool.release(connection)
+                else:
+                    connection.close()
+                self.logger.info("Connection '%s' closed", name)
+            except Exception as e:
+                self.logger.warning("Error closing connection '%s': %s", name, e)
+        
+        # Return all connections to their pools
+        if connections:
+            with ThreadPoolExecutor(max_workers=min(16, len(connections))) as executor:
+                list(executor.map(release_connection, connections))
+        
+        # Close all pools, dropping sessions that are still busy
+        for name, pool in pools.items():
+            try:
+                pool.close(force=True)
+                self.logger.info("Pool '%s' closed", name)
+            except Exception as e:
+                self.logger.warning("Error closing pool '%s': %s", name, e)
+        
+        # Dispose all SQLAlchemy engines
+        for engine in engines:
+            try:
+                engine.dispose()
+            except Exception as e:
+                self.logger.warning("Error disposing SQLAlchemy engine: %s", e)
+        
+        self.logger.info("All connections, pools and engines closed")
+    
+    def _name_lock(self, name: Union[str, tuple]) -> threading.Lock:
+        """Return the lock serializing creation of the pool and connection (or engine) for a name."""
+        with self._lock:
+            return self._name_locks[name]
+    
+    def _resolve_password(self, config: Dict[str, Any]) -> Optional[str]:
+        """Return the plain text password, decrypting each ciphertext only once."""
+        password = config.get('password')
+        if not config.get('password_encrypted', False):
+            return password
+        
+        with self._lock:
+            if password not in self._passwords:
+                self._passwords[password] = decrypt_password(password)
+            
+            return self._passwords[password]
+    
+    def _resolve_dsn(self, config: Dict[str, Any]) -> str:
+        """Return the DSN for a configuration."""
+        return _make_dsn(
+            config.get('host'),
+            config.get('port', 1521),
+            config.get('service_name'),
+            config.get('sid')
+        )
+    
+    @staticmethod
+    def _session_setup_sql(config: Dict[str, Any]) -> Optional[str]:
+        """
+        Build one PL/SQL block applying the session timezone and NLS parameters.
+        
+        Args:
+            config: Oracle configuration dictionary
             
-            self.logger.info("All connections and pools closed")
\ No newline at end of file
+        Returns:
+            Optional[str]: PL/SQL block, or None if there is nothing to set
+        """
+        statements = []
+        
+        # Set session timezone if specified
+        if config.get('timezone'):
+            statements.append(f"ALTER SESSION SET TIME_ZONE = '{config['timezone']}'")
+        
+        # Set NLS parameters
+        nls_params = config.get('nls_parameters', {})
+        for param, value in nls_params.items():
+            statements.append(f"ALTER SESSION SET {param} = '{value}'")
+        
+        if not statements:
+            return None
+        
+        body = " ".join(f"EXECUTE IMMEDIATE q'[{stmt}]';" for stmt in statements)
+        return f"BEGIN {body} END;"
+    
+    def _make_session_callback(self, config: Dict[str, Any]):
+        """
+        Create a pool session callback that initializes brand-new sessions.
+        
+        Pooled sessions keep their state, so the setup runs once per session
+        rather than on every acquire.
+        """
+        session_sql = self._session_setup_sql(config)
+        call_timeout = config.get('call_timeout_ms', 0)
+        if not session_sql and not call_timeout:
+            return None
+        
+        def init_session(connection: oracledb.Connection, requested_tag: Optional[str]):
+            # Bound each round-trip so a hung call cannot stall the session
+            if call_timeout:
+                connection.call_timeout = call_timeout
+            
+            if session_sql:
+                cursor = connection.cursor()
+                cursor.execute(session_sql)
+                cursor.close()
+        
+        return init_session
+    
+    def _init_client_mode(self, config: Dict[str, Any]):
+        """Initialize the Oracle thick client when requested; thin mode needs no setup."""
+        if config.get('thick_mode', False):
+            try:
+                oracledb.init_oracle_client()
+            except Exception as e:
+                self.logger.warning("Failed to initialize Oracle thick client: %s", e)
+    
+    @staticmethod
+    def _pool_name(config: Dict[str, Any]) -> str:
+        """Build a pool name identifying the DSN and user of a configuration."""
+        return (
+            f"{config.get('username')}@{config.get('host')}:{config.get('port', 1521)}"
+            f"/{config.get('service_name') or config.get('sid')}"
+        )
@@ -1,6 +1,6 @@
+from .etl_exception import ETLException
 from .config_exception import ConfigurationException
 from .connection_exception import ConnectionException
-from .etl_exception import ETLException
 from .extract_exception import ExtractionException
 from .load_exception import LoadingException
 from .transform_exception import TransformationException
@@ -1,13 +1,11 @@
 from typing import Optional, Dict
-from . import ETLException
+from .etl_exception import ETLException
 
 class ConfigurationException(ETLException):
     """Exception for configuration issues."""
     
+    CODE = "ETL_CONFIG_ERROR"
+    CATEGORY = "CONFIGURATION"
+    
     def __init__(self, message: str, context: Optional[Dict] = None):
-        super().__init__(
-            message=message,
-            error_code="ETL_CONFIG_ERROR",
-            error_category="CONFIGURATION",
-            context=context
-        )
\ No newline at end of file
+        super().__init__(message, context=context)
\ No newline at end of file
@@ -1,13 +1,11 @@
 from typing import Optional, Dict
-from . import ETLException
+from .etl_exception import ETLException
 
 class ConnectionException(ETLException):
     """Exception for database connection issues."""
     
+    CODE = "ETL_CONNECTION_ERROR"
+    CATEGORY = "CONNECTION"
+    
     def __init__(self, message: str, context: Optional[Dict] = None):
-        super().__init__(
-            message=message,
-            error_code="ETL_CONNECTION_ERROR",
-            error_category="CONNECTION",
-            context=context
-        )
\ No newline at end of file
+        super().__init__(message, context=context)
\ No newline at end of file
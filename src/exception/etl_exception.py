@@ -1,20 +1,43 @@
 from typing import Dict, Any, Optional
 from datetime import datetime
+import time
 
 class ETLException(Exception):
     """
     Custom exception class for ETL operations.
     Provides additional context and categorization for ETL-specific errors.
+    
+    Subclasses declare ``CODE`` and ``CATEGORY``, which are read here as
+    the defaults, and take only ``(message, context)``.
     """
     
+    CODE = "ETL_GENERIC_ERROR"
+    CATEGORY = "UNKNOWN"
+    
     def __init__(self, message: str, error_code: Optional[str] = None, 
                  error_category: Optional[str] = None, context: Optional[Dict] = None):
         super().__init__(message)
         self.message = message
-        self.error_code = error_code or "ETL_GENERIC_ERROR"
-        self.error_category = error_category or "UNKNOWN"
-        self.context = context or {}
-        self.timestamp = datetime.now()
+        self.error_code = error_code or type(self).CODE
+        self.error_category = error_category or type(self).CATEGORY
+        self._context = context
+        self._timestamp_ns = time.time_ns()
+    
+    @property
+    def context(self) -> Dict:
+        """Error context, allocated on first access when none was given."""
+        if self._context is None:
+            self._context = {}
+        return self._context
+    
+    @context.setter
+    def context(self, value: Optional[Dict]):
+        self._context = value
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Time the exception was created."""
+        return datetime.fromtimestamp(self._timestamp_ns / 1e9)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging/serialization."""
@@ -24,4 +47,4 @@ class ETLException(Exception):
             'error_category': self.error_category,
             'context': self.context,
             'timestamp': self.timestamp.isoformat()
-        }
\ No newline at end of file
+        }
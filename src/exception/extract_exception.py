@@ -1,13 +1,11 @@
 from typing import Optional, Dict
-from . import ETLException
+from .etl_exception import ETLException
 
 class ExtractionException(ETLException):
     """Exception for data extraction issues."""
     
+    CODE = "ETL_EXTRACTION_ERROR"
+    CATEGORY = "EXTRACTION"
+    
     def __init__(self, message: str, context: Optional[Dict] = None):
-        super().__init__(
-            message=message,
-            error_code="ETL_EXTRACTION_ERROR",
-            error_category="EXTRACTION",
-            context=context
-        )
\ No newline at end of file
+        super().__init__(message, context=context)
\ No newline at end of file
@@ -1,13 +1,11 @@
 from typing import Optional, Dict
-from . import ETLException
+from .etl_exception import ETLException
 
 class LoadingException(ETLException):
     """Exception for data loading issues."""
     
+    CODE = "ETL_LOADING_ERROR"
+    CATEGORY = "LOADING"
+    
     def __init__(self, message: str, context: Optional[Dict] = None):
-        super().__init__(
-            message=message,
-            error_code="ETL_LOADING_ERROR",
-            error_category="LOADING",
-            context=context
-        )
\ No newline at end of file
+        super().__init__(message, context=context)
\ No newline at end of file
@@ -1,13 +1,11 @@
 from typing import Optional, Dict
-from . import ETLException
+from .etl_exception import ETLException
 
 class TransformationException(ETLException):
     """Exception for data transformation issues."""
     
+    CODE = "ETL_TRANSFORMATION_ERROR"
+    CATEGORY = "TRANSFORMATION"
+    
     def __init__(self, message: str, context: Optional[Dict] = None):
-        super().__init__(
-            message=message,
-            error_code="ETL_TRANSFORMATION_ERROR",
-            error_category="TRANSFORMATION",
-            context=context
-        )
\ No newline at end of file
+        super().__init__(message, context=context)
\ No newline at end of file
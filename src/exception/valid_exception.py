@@ -1,13 +1,11 @@
 from typing import Optional, Dict
-from . import ETLException
+from .etl_exception import ETLException
 
 class ValidationException(ETLException):
     """Exception for data validation issues."""
     
+    CODE = "ETL_VALIDATION_ERROR"
+    CATEGORY = "VALIDATION"
+    
     def __init__(self, message: str, context: Optional[Dict] = None):
-        super().__init__(
-            message=message,
-            error_code="ETL_VALIDATION_ERROR",
-            error_category="VALIDATION",
-            context=context
-        )
\ No newline at end of file
+        super().__init__(message, context=context)
\ No newline at end of file
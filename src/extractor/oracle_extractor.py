@@ -1,13 +1,51 @@
 import oracledb
 import os
+import threading
+from collections import namedtuple
 from contextlib import contextmanager
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Iterator, Union
+
+_thick_mode_lock = threading.Lock()
+_thick_mode_initialized = False
+
+
+def _init_thick_once(lib_dir: Optional[str] = None, config_dir: Optional[str] = None):
+    """Initialise the Oracle client for thick mode once per process."""
+    global _thick_mode_initialized
+    
+    with _thick_mode_lock:
+        if _thick_mode_initialized:
+            return
+        
+        params = {}
+        if lib_dir:
+            params['lib_dir'] = lib_dir
+        if config_dir:
+            params['config_dir'] = config_dir
+        
+        oracledb.init_oracle_client(**params)
+        _thick_mode_initialized = True
+
+
+# Outcome of execute_batch when per-row details are requested: total rows
+# affected, rows affected per parameter set (or None), and the failed rows
+BatchResult = namedtuple("BatchResult", ["rowcount", "row_counts", "errors"])
+
+
+@lru_cache(maxsize=128)
+def _row_class(columns: tuple) -> type:
+    """Build a named tuple row type, cached per column list."""
+    return namedtuple("Row", columns, rename=True)
+
 
 class OracleDBManager:
     """A class to manage Oracle database connections and queries."""
     
     def __init__(self, username: str, password: str, dsn: str, 
-                 config_dir: Optional[str] = None, wallet_location: Optional[str] = None):
+                 config_dir: Optional[str] = None, wallet_location: Optional[str] = None,
+                 arraysize: int = 10_000, pool_min: int = 2, pool_max: int = 10,
+                 sdu: int = 65535, mode: str = "thin", lib_dir: Optional[str] = None):
         """
         Initialize Oracle DB connection parameters.
         
@@ -17,53 +55,81 @@ class OracleDBManager:
             dsn: Data Source Name (host:port/service_name or TNS alias)
             config_dir: Directory containing tnsnames.ora and sqlnet.ora
             wallet_location: Path to Oracle Wallet for secure connections
+            arraysize: Rows fetched per round-trip by queries; set on the
+                cursors this class opens rather than on oracledb.defaults
+            pool_min: Minimum number of pooled sessions
+            pool_max: Maximum number of pooled sessions
+            sdu: Session data unit size in bytes requested for connections
+            mode: "thin" (default) or "thick" to use Oracle Instant Client
+            lib_dir: Instant Client directory for thick mode (optional)
         """
         self.username = username
         self.password = password
         self.dsn = dsn
         self.config_dir = config_dir
         self.wallet_location = wallet_location
+        self.arraysize = arraysize
+        self.pool_min = pool_min
+        self.pool_max = pool_max
+        self.sdu = sdu
+        self._pool = None
+        self._pool_lock = threading.Lock()
         
-        # Instant Client for Thick Mode --- Thin mode not available
-        lib_dir = r"\\localhost\c$\Users\trinh.quoc-quang\my-projects\auto_sbv\driver\instantclient_23_8"
-
-        # Initialize Oracle client if needed
-        if config_dir:
-            oracledb.init_oracle_client(config_dir=config_dir, lib_dir=lib_dir)
-        elif wallet_location:
-            oracledb.init_oracle_client(config_dir=wallet_location, lib_dir=lib_dir)
-        else:
-            oracledb.init_oracle_client(lib_dir=lib_dir)
+        # Thick mode is process-wide, so only initialise it when asked for
+        if mode == "thick":
+            _init_thick_once(lib_dir=lib_dir, config_dir=config_dir or wallet_location)
+    
+    def _get_pool(self) -> oracledb.ConnectionPool:
+        """Create the session pool on first use and return it."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    params = dict(
+                        user=self.username,
+                        password=self.password,
+                        dsn=self.dsn,
+                        min=self.pool_min,
+                        max=self.pool_max,
+                        increment=1,
+                        getmode=oracledb.POOL_GETMODE_WAIT,
+                        homogeneous=True,
+                        # Large SDU so each packet carries more fetched rows.
+                        # tcp.nodelay is left off: it fragments bulk fetches.
+                        sdu=self.sdu
+                    )
+                    if self.config_dir:
+                        params['config_dir'] = self.config_dir
+                    if self.wallet_location:
+                        # For Oracle Cloud or wallet-based connections
+                        params.update(
+                            config_dir=self.wallet_location,
+                            wallet_location=self.wallet_location,
+                            wallet_password=""  # Usually empty for auto-login wallets
+                        )
+                    self._pool = oracledb.create_pool(**params)
+        return self._pool
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
+        """Context manager for pooled database connections."""
         connection = None
         try:
-            if self.wallet_location:
-                # For Oracle Cloud or wallet-based connections
-                connection = oracledb.connect(
-                    user=self.username,
-                    password=self.password,
-                    dsn=self.dsn,
-                    config_dir=self.wallet_location,
-                    wallet_location=self.wallet_location,
-                    wallet_password=""  # Usually empty for auto-login wallets
-                )
-            else:
-                # Standard connection
-                connection = oracledb.connect(
-                    user=self.username,
-                    password=self.password,
-                    dsn=self.dsn
-                )
+            pool = self._get_pool()
+            connection = pool.acquire()
             yield connection
         except oracledb.Error as e:
             print(f"Database connection error: {e}")
             raise
         finally:
             if connection:
-                connection.close()
+                pool.release(connection)
+    
+    def close(self):
+        """Close the session pool and every connection in it."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close(force=True)
+                self._pool = None
     
     def execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
         """
@@ -78,6 +144,8 @@ class OracleDBManager:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.arraysize = self.arraysize
+            cursor.prefetchrows = self.arraysize + 1
             try:
                 if params:
                     cursor.execute(query, params)
@@ -99,6 +167,133 @@ class OracleDBManager:
             finally:
                 cursor.close()
     
+    def iter_query(self, query: str, params: tuple = None,
+                   row_factory: Optional[Callable[[List[str], tuple], Any]] = None) -> Iterator[Any]:
+        """
+        Execute a SELECT query and yield rows as they are fetched.
+        
+        Only one fetch buffer of ``arraysize`` rows is held in memory at a
+        time; the connection returns to the pool when iteration ends.
+        
+        Args:
+            query: SQL SELECT statement
+            params: Query parameters (optional)
+            row_factory: Callable taking the column names and a row tuple,
+                applied to each row (optional)
+            
+        Yields:
+            Row tuples, or the result of ``row_factory`` for each row
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = self.arraysize
+            cursor.prefetchrows = self.arraysize + 1
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                if row_factory is None:
+                    yield from cursor
+                else:
+                    columns = [desc[0] for desc in cursor.description]
+                    for row in cursor:
+                        yield row_factory(columns, row)
+                
+            except oracledb.Error as e:
+                print(f"Query execution error: {e}")
+                raise
+            finally:
+                cursor.close()
+    
+    def execute_query_named(self, query: str, params: tuple = None) -> List[tuple]:
+        """
+        Execute a SELECT query and return results as named tuples.
+        
+        Rows support attribute and index access, and ``row._asdict()``
+        where a dictionary is needed.
+        
+        Args:
+            query: SQL SELECT statement
+            params: Query parameters (optional)
+            
+        Returns:
+            List of named tuples representing query results
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = self.arraysize
+            cursor.prefetchrows = self.arraysize + 1
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                row_class = _row_class(tuple(desc[0] for desc in cursor.description))
+                return list(map(row_class._make, cursor.fetchall()))
+                
+            except oracledb.Error as e:
+                print(f"Query execution error: {e}")
+                raise
+            finally:
+                cursor.close()
+    
+    def execute_query_df(self, query: str, params: tuple = None):
+        """
+        Execute a SELECT query and return results as a columnar data frame.
+        
+        Args:
+            query: SQL SELECT statement
+            params: Query parameters (optional)
+            
+        Returns:
+            OracleDataFrame, convertible to pyarrow or pandas without copying
+        """
+        with self.get_connection() as conn:
+            try:
+                return conn.fetch_df_all(query, params, arraysize=self.arraysize)
+            except oracledb.Error as e:
+                print(f"Query execution error: {e}")
+                raise
+    
+    def execute_query_columnar(self, query: str, params: tuple = None) -> Dict[str, List[Any]]:
+        """
+        Execute a SELECT query and return results as a dictionary of columns.
+        
+        Args:
+            query: SQL SELECT statement
+            params: Query parameters (optional)
+            
+        Returns:
+            Dictionary mapping each column name to a list of its values
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = self.arraysize
+            cursor.prefetchrows = self.arraysize + 1
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                columns = [desc[0] for desc in cursor.description]
+                
+                # Transpose the rows once instead of building a dict per row
+                rows = cursor.fetchall()
+                values = zip(*rows) if rows else ([] for _ in columns)
+                
+                return {column: list(column_values)
+                        for column, column_values in zip(columns, values)}
+                
+            except oracledb.Error as e:
+                print(f"Query execution error: {e}")
+                raise
+            finally:
+                cursor.close()
+    
     def execute_dml(self, statement: str, params: tuple = None) -> int:
         """
         Execute DML statements (INSERT, UPDATE, DELETE).
@@ -129,24 +324,51 @@ class OracleDBManager:
             finally:
                 cursor.close()
     
-    def execute_batch(self, statement: str, params_list: List[tuple]) -> int:
+    def execute_batch(self, statement: str, params_list: List[tuple],
+                      input_sizes: Optional[tuple] = None,
+                      batch_errors: bool = False,
+                      row_counts: bool = False) -> Union[int, BatchResult]:
         """
         Execute batch DML operations for better performance.
         
         Args:
-            statement: SQL DML statement
+            statement: SQL DML statement (or PL/SQL block)
             params_list: List of parameter tuples
+            input_sizes: Bind types/sizes per column passed to setinputsizes,
+                e.g. ``(oracledb.DB_TYPE_NUMBER, 200)`` (optional)
+            batch_errors: Commit the rows that succeeded and return the
+                failing ones instead of rolling back the whole batch
+            row_counts: Also return the rows affected by each parameter set;
+                only valid for INSERT, UPDATE, DELETE and MERGE
             
         Returns:
-            Total number of affected rows
+            Total number of affected rows, or a BatchResult of the total,
+            the per-row counts and the ``oracledb`` batch errors when
+            ``batch_errors`` or ``row_counts`` is set
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             try:
-                cursor.executemany(statement, params_list)
+                # Declared sizes spare the driver a scan of every row
+                if input_sizes:
+                    cursor.setinputsizes(*input_sizes)
+                
+                cursor.executemany(statement, params_list,
+                                   batcherrors=batch_errors,
+                                   arraydmlrowcounts=row_counts)
                 affected_rows = cursor.rowcount
+                
+                if not (batch_errors or row_counts):
+                    conn.commit()
+                    return affected_rows
+                
+                result = BatchResult(
+                    rowcount=affected_rows,
+                    row_counts=cursor.getarraydmlrowcounts() if row_counts else None,
+                    errors=cursor.getbatcherrors() if batch_errors else []
+                )
                 conn.commit()
-                return affected_rows
+                return result
                 
             except oracledb.Error as e:
                 conn.rollback()
@@ -179,8 +401,11 @@ def main():
     # Construct DSN (Data Source Name)
     dsn = f"{host}:{port}/{service_name}"
     
+    # Instant Client for Thick Mode --- Thin mode not available
+    lib_dir = r"\\localhost\c$\Users\trinh.quoc-quang\my-projects\auto_sbv\driver\instantclient_23_8"
+    
     # Initialize database manager
-    db_manager = OracleDBManager(username, password, dsn)
+    db_manager = OracleDBManager(username, password, dsn, mode="thick", lib_dir=lib_dir)
     
     # Test connection
     if not db_manager.test_connection():
@@ -3,12 +3,30 @@
 # - Implement method NotificationService.send_error_notification
 
 from typing import Optional, Dict, Any, Callable
+from collections import Counter, deque
 from functools import wraps
-import traceback
+from itertools import islice
+from hashlib import blake2b
+import logging
+import random
+import sys
+import time
 
 from src.exception import ETLException
 from src.util.logger import ETLLogger
 
+class _ContextText:
+    """Render an error context as ``key=value`` pairs when logged."""
+    
+    __slots__ = ('context',)
+    
+    def __init__(self, context: Dict):
+        self.context = context
+    
+    def __str__(self) -> str:
+        return ", ".join(f"{k}={v}" for k, v in self.context.items())
+
+
 class ETLExceptionHandler:
     """
     Centralized exception handler for ETL operations.
@@ -21,14 +39,20 @@ class ETLExceptionHandler:
         self.notification_service = None
         
         # Error tracking
-        self.error_counts = {}
-        self.error_history = []
+        self.error_counts = Counter()
+        self.category_counts = Counter()
+        self.total_errors = 0
+        self.error_history = deque(maxlen=1000)
         
         # Configuration
         self.max_retry_attempts = self.config.get('max_retry_attempts', 3)
         self.send_notifications = self.config.get('send_notifications', False)
         self.log_stack_trace = self.config.get('log_stack_trace', True)
         self.error_threshold = self.config.get('error_threshold', 10)
+        self.duplicate_window = self.config.get('duplicate_error_window', 1.0)
+        
+        # Last time each distinct error was logged, for duplicate suppression
+        self._recent_errors = {}
     
     def handle_exception(self, exception: Exception, context: Optional[Dict] = None, 
                         operation: Optional[str] = None, 
@@ -61,6 +85,18 @@ class ETLExceptionHandler:
         if operation:
             etl_exception.context['operation'] = operation
         
+        should_notify = notify and self.send_notifications and self.notification_service
+        
+        # Repeats of a recent error are counted but not logged or serialised again
+        if not should_notify and self._is_duplicate(etl_exception):
+            self._track_error(etl_exception)
+            return {
+                'handled': True,
+                'duplicate': True,
+                'error_id': self._generate_error_id(etl_exception),
+                'timestamp': etl_exception.timestamp
+            }
+        
         # Log the exception
         self._log_exception(etl_exception)
         
@@ -68,7 +104,7 @@ class ETLExceptionHandler:
         self._track_error(etl_exception)
         
         # Send notification if enabled
-        if notify and self.send_notifications and self.notification_service:
+        if should_notify:
             self._send_notification(etl_exception)
         
         # Return error details
@@ -79,35 +115,66 @@ class ETLExceptionHandler:
             'timestamp': etl_exception.timestamp
         }
     
+    def _is_duplicate(self, exception: ETLException) -> bool:
+        """
+        Check whether the same error was handled within the duplicate window.
+        
+        Args:
+            exception: The exception being handled
+            
+        Returns:
+            bool: True if an identical error was seen within the window
+        """
+        if self.duplicate_window <= 0:
+            return False
+        
+        key = (exception.error_category, exception.error_code, exception.message)
+        now = time.monotonic()
+        last_seen = self._recent_errors.get(key)
+        
+        if last_seen is not None and now - last_seen < self.duplicate_window:
+            return True
+        
+        # Forget stale keys rather than letting the map grow without bound
+        if len(self._recent_errors) >= 1024:
+            self._recent_errors = {
+                k: t for k, t in self._recent_errors.items()
+                if now - t < self.duplicate_window
+            }
+        self._recent_errors[key] = now
+        return False
+    
     def _log_exception(self, exception: ETLException):
         """Log the exception with appropriate level and details."""
-        error_msg = f"[{exception.error_category}] {exception.message}"
+        # Categories logged as warnings; everything else is an error
+        if exception.error_category in ('VALIDATION', 'TRANSFORMATION'):
+            level = logging.WARNING
+        else:
+            level = logging.ERROR
         
-        # Add context to log message
+        # Arguments are only formatted if a handler emits the record
         if exception.context:
-            context_str = ", ".join([f"{k}={v}" for k, v in exception.context.items()])
-            error_msg += f" | Context: {context_str}"
-        
-        # Log based on error category
-        if exception.error_category in ['CONNECTION', 'CONFIGURATION']:
-            self.logger.error(error_msg)
-        elif exception.error_category in ['VALIDATION', 'TRANSFORMATION']:
-            self.logger.warning(error_msg)
+            self.logger.log(level, "[%s] %s | Context: %s", exception.error_category,
+                            exception.message, _ContextText(exception.context))
         else:
-            self.logger.error(error_msg)
+            self.logger.log(level, "[%s] %s", exception.error_category, exception.message)
         
-        # Log stack trace if enabled
-        if self.log_stack_trace:
-            self.logger.error(f"Stack trace: {traceback.format_exc()}")
+        # Log stack trace if enabled; the handler formats it only if emitted
+        if self.log_stack_trace and self.logger.isEnabledFor(logging.ERROR):
+            exc_info = sys.exc_info()
+            if exc_info[0] is not None:
+                self.logger.error("Stack trace:", exc_info=exc_info)
     
     def _track_error(self, exception: ETLException):
         """Track error for monitoring and analysis."""
         error_key = f"{exception.error_category}:{exception.error_code}"
         
-        # Increment error count
-        self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
+        # Increment error counts
+        self.error_counts[error_key] += 1
+        self.category_counts[exception.error_category] += 1
+        self.total_errors += 1
         
-        # Add to error history
+        # Add to error history (only the last 1000 are kept)
         self.error_history.append({
             'timestamp': exception.timestamp,
             'category': exception.error_category,
@@ -116,14 +183,9 @@ class ETLExceptionHandler:
             'context': exception.context
         })
         
-        # Keep only recent errors (last 1000)
-        if len(self.error_history) > 1000:
-            self.error_history = self.error_history[-1000:]
-        
         # Check if error threshold exceeded
-        total_errors = sum(self.error_counts.values())
-        if total_errors >= self.error_threshold:
-            self.logger.critical(f"Error threshold exceeded: {total_errors} errors")
+        if self.total_errors >= self.error_threshold:
+            self.logger.critical(f"Error threshold exceeded: {self.total_errors} errors")
     
     def _send_notification(self, exception: ETLException):
         """Send notification about the error."""
@@ -139,10 +201,8 @@ class ETLExceptionHandler:
     
     def _generate_error_id(self, exception: ETLException) -> str:
         """Generate unique error ID for tracking."""
-        import hashlib
-        
         error_string = f"{exception.timestamp}{exception.error_code}{exception.message}"
-        return hashlib.md5(error_string.encode()).hexdigest()[:8]
+        return blake2b(error_string.encode(), digest_size=4).hexdigest()
     
     def retry_on_exception(self, exceptions: tuple = (Exception,), 
                           max_attempts: Optional[int] = None,
@@ -172,12 +232,12 @@ class ETLExceptionHandler:
                             )
                             raise
                         else:
-                            wait_time = backoff_factor ** attempt
+                            # Jitter keeps concurrent workers from retrying in lockstep
+                            wait_time = (backoff_factor ** attempt) * (0.5 + random.random())
                             self.logger.warning(
                                 f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. "
-                                f"Retrying in {wait_time} seconds..."
+                                f"Retrying in {wait_time:.2f} seconds..."
                             )
-                            import time
                             time.sleep(wait_time)
                 
             return wrapper
@@ -215,30 +275,25 @@ class ETLExceptionHandler:
         Returns:
             Dict: Error summary statistics
         """
-        total_errors = sum(self.error_counts.values())
-        
-        # Get error breakdown by category
-        category_counts = {}
-        for error_key, count in self.error_counts.items():
-            category = error_key.split(':')[0]
-            category_counts[category] = category_counts.get(category, 0) + count
-        
         # Get recent errors (last 10)
-        recent_errors = self.error_history[-10:] if self.error_history else []
+        recent_errors = list(islice(reversed(self.error_history), 10))[::-1]
         
         return {
-            'total_errors': total_errors,
-            'error_categories': category_counts,
+            'total_errors': self.total_errors,
+            'error_categories': dict(self.category_counts),
             'error_counts': self.error_counts,
             'recent_errors': recent_errors,
             'error_threshold': self.error_threshold,
-            'threshold_exceeded': total_errors >= self.error_threshold
+            'threshold_exceeded': self.total_errors >= self.error_threshold
         }
     
     def reset_error_tracking(self):
         """Reset error tracking counters and history."""
         self.error_counts.clear()
+        self.category_counts.clear()
+        self.total_errors = 0
         self.error_history.clear()
+        self._recent_errors.clear()
         self.logger.info("Error tracking reset")
     
     def create_context_manager(self, operation: str, context: Optional[Dict] = None):
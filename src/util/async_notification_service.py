@@ -0,0 +1,181 @@
+import asyncio
+from email.message import EmailMessage
+from typing import List, Dict, Any, Optional
+import logging
+
+from src.util.notification_service import NotifyStatus
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
+
+class AsyncNotificationService:
+    """
+    Asyncio counterpart of NotificationService for callers that already run
+    inside an event loop. Uses one pooled aiohttp session for Slack and
+    webhook calls and aiosmtplib for email, so sends never park a thread.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if aiohttp is None or aiosmtplib is None:
+            raise ImportError("AsyncNotificationService requires the aiohttp and aiosmtplib packages")
+        
+        self.logger = logging.getLogger(__name__)
+        self.config = config or {}
+        
+        # Email configuration
+        self.smtp_server = self.config.get('smtp_server', 'localhost')
+        self.smtp_port = self.config.get('smtp_port', 587)
+        self.smtp_username = self.config.get('smtp_username')
+        self.smtp_password = self.config.get('smtp_password')
+        self.from_email = self.config.get('from_email', 'etl@company.com')
+        
+        # Slack configuration
+        self.slack_webhook_url = self.config.get('slack_webhook_url')
+        self.slack_channel = self.config.get('slack_channel', '#etl-alerts')
+        
+        # Webhook configuration
+        self.webhook_urls = self.config.get('webhook_urls', [])
+        
+        # The session must be created inside the running loop, so it is
+        # opened on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._timeout = aiohttp.ClientTimeout(total=10)
+    
+    async def __aenter__(self) -> 'AsyncNotificationService':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def close(self):
+        """Close the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self._timeout)
+        return self._session
+    
+    async def send_email(self, to_emails: List[str], subject: str,
+                         message: str, html_message: Optional[str] = None) -> NotifyStatus:
+        """
+        Send email notification.
+        
+        Args:
+            to_emails: List of recipient email addresses
+            subject: Email subject
+            message: Plain text message
+            html_message: HTML message (optional)
+        
+        Returns:
+            NotifyStatus: SENT or FAILED
+        """
+        try:
+            msg = EmailMessage()
+            # Header values may not contain line breaks
+            msg['Subject'] = ' '.join(subject.splitlines())
+            msg['From'] = self.from_email
+            msg['To'] = ', '.join(to_emails)
+            
+            msg.set_content(message)
+            if html_message:
+                msg.add_alternative(html_message, subtype='html')
+            
+            use_auth = bool(self.smtp_username and self.smtp_password)
+            await aiosmtplib.send(
+                msg,
+                hostname=self.smtp_server,
+                port=self.smtp_port,
+                username=self.smtp_username if use_auth else None,
+                password=self.smtp_password if use_auth else None,
+                start_tls=use_auth
+            )
+            
+            self.logger.info("Email sent successfully to %s", ', '.join(to_emails))
+            return NotifyStatus.SENT
+        
+        except Exception as e:
+            self.logger.error("Failed to send email: %s", e)
+            return NotifyStatus.FAILED
+    
+    async def send_slack_notification(self, message: str,
+                                      channel: Optional[str] = None) -> NotifyStatus:
+        """
+        Send Slack notification.
+        
+        Args:
+            message: Message to send
+            channel: Slack channel (optional, uses default if not provided)
+        
+        Returns:
+            NotifyStatus: SENT, SKIPPED if Slack is not configured, or FAILED
+        """
+        if not self.slack_webhook_url:
+            self.logger.warning("Slack webhook URL not configured")
+            return NotifyStatus.SKIPPED
+        
+        try:
+            payload = {
+                'text': message,
+                'channel': channel or self.slack_channel,
+                'username': 'ETL Framework'
+            }
+            
+            async with self._get_session().post(self.slack_webhook_url, json=payload) as response:
+                if response.status == 200:
+                    self.logger.info("Slack notification sent successfully")
+                    return NotifyStatus.SENT
+                else:
+                    self.logger.error("Slack notification failed: %s", response.status)
+                    return NotifyStatus.FAILED
+        
+        except Exception as e:
+            self.logger.error("Failed to send Slack notification: %s", e)
+            return NotifyStatus.FAILED
+    
+    async def send_webhook_notification(self, data: Dict[str, Any]) -> NotifyStatus:
+        """
+        Send webhook notification to every configured URL concurrently.
+        
+        Args:
+            data: Data to send in webhook
+        
+        Returns:
+            NotifyStatus: SENT if every URL accepted it, SKIPPED if no URLs
+                are configured, or FAILED
+        """
+        if not self.webhook_urls:
+            self.logger.warning("No webhook URLs configured")
+            return NotifyStatus.SKIPPED
+        
+        results = await asyncio.gather(
+            *[self._send_webhook(webhook_url, data) for webhook_url in self.webhook_urls]
+        )
+        
+        return NotifyStatus.SENT if all(results) else NotifyStatus.FAILED
+    
+    async def _send_webhook(self, webhook_url: str, data: Dict[str, Any]) -> bool:
+        """POST data to a single webhook URL."""
+        try:
+            async with self._get_session().post(webhook_url, json=data) as response:
+                if response.status in [200, 201, 202]:
+                    self.logger.info("Webhook notification sent to %s", webhook_url)
+                    return True
+                else:
+                    self.logger.error("Webhook failed for %s: %s", webhook_url, response.status)
+                    return False
+        
+        except Exception as e:
+            self.logger.error("Failed to send webhook to %s: %s", webhook_url, e)
+            return False
@@ -1,11 +1,83 @@
+import copy
 import yaml
 import json
 import os
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
+import threading
 from datetime import datetime
 
+# Prefer the libyaml-backed loader and dumper; fall back to the pure-Python ones
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed files shared by every ConfigManager in the process, keyed by
+# resolved path: (mtime_ns, size, config, env_refs); least recently
+# used entries are dropped beyond _PARSE_CACHE_MAX
+_PARSE_CACHE: OrderedDict[Path, Tuple[int, int, Dict[str, Any], List[Tuple[tuple, str]]]] = OrderedDict()
+_PARSE_CACHE_MAX = 100
+_PARSE_CACHE_LOCK = threading.Lock()
+# Per-file locks, created under _PARSE_CACHE_LOCK
+_PATH_LOCKS: Dict[Path, threading.Lock] = defaultdict(threading.Lock)
+
+# Fields every Oracle database config must define
+_REQUIRED_DATABASE_FIELDS = ('host', 'username', 'password')
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _is_env_ref(value: Any) -> bool:
+    """Check whether a value is a whole-string ``${VAR}`` reference."""
+    return isinstance(value, str) and value.startswith('${') and value.endswith('}')
+
+
+def _compile_env_refs(config: Any) -> List[Tuple[tuple, str]]:
+    """
+    Find every ``${VAR}`` value in a config tree.
+    
+    Args:
+        config: Parsed configuration (dicts, lists and scalars)
+        
+    Returns:
+        List: ``(path, token)`` pairs, where path is the tuple of keys and
+            list indices leading to the value
+    """
+    refs = []
+    stack = [((), config)] if isinstance(config, (dict, list)) else []
+    
+    while stack:
+        path, container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                stack.append((path + (key,), value))
+            elif _is_env_ref(value):
+                refs.append((path + (key,), value))
+    
+    return refs
+
+
+def _refs_under(refs: List[Tuple[tuple, str]], prefix: tuple) -> List[Tuple[tuple, str]]:
+    """Select the references below ``prefix``, with paths made relative to it."""
+    depth = len(prefix)
+    return [(path[depth:], token) for path, token in refs
+            if len(path) > depth and path[:depth] == prefix]
+
 
 class ConfigManager:
     """
@@ -13,56 +85,231 @@ class ConfigManager:
     Handles loading, validation, and management of configuration files.
     """
     
-    def __init__(self, config_dir: Union[str, Path] = "config"):
+    # Configuration file for each config type
+    _CONFIG_FILES = {
+        'database': 'database_configs.yml',
+        'etl_jobs': 'etl_jobs.yml',
+        'logging': 'logging_config.yml',
+        'schedule': 'schedule_config.yml',
+        'transformation': 'transformation_rules.yml'
+    }
+    
+    def __init__(self, config_dir: Union[str, Path] = "config", enable_json_cache: bool = False,
+                 preload: bool = False):
+        """
+        Initialize the configuration manager.
+        
+        Args:
+            config_dir: Directory containing the configuration files
+            enable_json_cache: Keep JSON sidecar caches next to YAML files
+            preload: Load every config type up front instead of on first use
+        """
         self.config_dir = Path(config_dir)
+        self.enable_json_cache = enable_json_cache
+        self.preload = preload
         self.logger = logging.getLogger(__name__)
         self._configs = {}
-        self._load_all_configs()
+        # ``${VAR}`` reference paths per config type, compiled once per parse
+        self._env_refs = {}
+        # Config types whose file is missing or failed to load
+        self._unavailable = set()
+        # Memoized getter results by (kind, name); cleared whenever configs change
+        self._resolved = {}
+        # Transformation rules by table name, built on first lookup
+        self._transform_by_table = None
+        
+        if preload:
+            self._load_all_configs()
     
     def _load_all_configs(self):
         """Load all configuration files from the config directory."""
-        if not self.config_dir.exists():
+        # One directory listing tells which files exist
+        try:
+            with os.scandir(self.config_dir) as entries:
+                available = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
             self.logger.warning(f"Config directory {self.config_dir} does not exist")
             return
         
-        config_files = {
-            'database': 'database_configs.yml',
-            'etl_jobs': 'etl_jobs.yml',
-            'logging': 'logging_config.yml',
-            'schedule': 'schedule_config.yml',
-            'transformation': 'transformation_rules.yml'
-        }
-        
-        for config_type, filename in config_files.items():
-            config_path = self.config_dir / filename
-            if config_path.exists():
-                try:
-                    self._configs[config_type] = self._load_config_file(config_path)
-                    self.logger.info(f"Loaded {config_type} configuration from {filename}")
-                except Exception as e:
-                    self.logger.error(f"Failed to load {config_type} config: {str(e)}")
-            else:
+        to_load = []
+        for config_type, filename in self._CONFIG_FILES.items():
+            if filename not in available:
                 self.logger.warning(f"Config file {filename} not found")
+                self._unavailable.add(config_type)
+                continue
+            
+            to_load.append(config_type)
+        
+        if len(to_load) <= 1:
+            for config_type in to_load:
+                self._load_config_type(config_type)
+            return
+        
+        # Read and parse the files concurrently; each config type writes only
+        # its own entries and _load_config_file locks per file
+        with ThreadPoolExecutor(max_workers=len(to_load)) as executor:
+            list(executor.map(self._load_config_type, to_load))
     
-    def _load_config_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load a single configuration file."""
-        with open(file_path, 'r') as f:
-            if file_path.suffix in ['.yml', '.yaml']:
-                # Handle multiple YAML documents
-                configs = list(yaml.safe_load_all(f))
-                if len(configs) == 1:
-                    return configs[0]
-                else:
-                    # Merge multiple documents
-                    merged_config = {}
-                    for config in configs:
-                        if config:
-                            merged_config.update(config)
-                    return merged_config
-            elif file_path.suffix == '.json':
-                return json.load(f)
+    def _ensure_loaded(self, config_type: str) -> Dict[str, Any]:
+        """
+        Load a config type on first access.
+        
+        Args:
+            config_type: Type of configuration
+            
+        Returns:
+            Dict: Configuration, or an empty dict if it is not available
+        """
+        config = self._configs.get(config_type)
+        if config is not None:
+            return config
+        
+        if config_type in self._CONFIG_FILES and config_type not in self._unavailable:
+            self._load_config_type(config_type)
+        
+        return self._configs.get(config_type, {})
+    
+    def _load_config_type(self, config_type: str):
+        """Load the file for one config type, recording it as unavailable on failure."""
+        filename = self._CONFIG_FILES[config_type]
+        
+        try:
+            config, env_refs = self._load_config_file(self.config_dir / filename)
+        except FileNotFoundError:
+            self.logger.warning(f"Config file {filename} not found")
+            self._unavailable.add(config_type)
+            return
+        except Exception as e:
+            self.logger.error(f"Failed to load {config_type} config: {str(e)}")
+            self._unavailable.add(config_type)
+            return
+        
+        self._configs[config_type] = config
+        self._env_refs[config_type] = env_refs
+        self.logger.info(f"Loaded {config_type} configuration from {filename}")
+    
+    def _load_config_file(self, file_path: Path) -> Tuple[Dict[str, Any], List[Tuple[tuple, str]]]:
+        """
+        Load a single configuration file.
+        
+        Parsed files are cached process-wide by resolved path and reused
+        while their modification time and size are unchanged. Each call
+        returns its own deep copy, so callers never share the cached tree.
+        
+        Args:
+            file_path: Path to the configuration file
+            
+        Returns:
+            Tuple: Parsed configuration and the ``(path, token)`` pairs of
+                its ``${VAR}`` values; the pairs are compiled once per parse
+                and shared, so they must not be modified
+        """
+        stat = file_path.stat()
+        key = file_path.resolve()
+        
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(key)
+            path_lock = _PATH_LOCKS[key]
+        if cached is not None and cached[:2] == stamp:
+            return copy.deepcopy(cached[2]), cached[3]
+        
+        # Parse outside the shared lock; the per-file lock lets distinct
+        # files load in parallel while one file is only parsed once
+        with path_lock:
+            with _PARSE_CACHE_LOCK:
+                cached = _PARSE_CACHE.get(key)
+            if cached is not None and cached[:2] == stamp:
+                return copy.deepcopy(cached[2]), cached[3]
+            
+            if self.enable_json_cache and file_path.suffix in ['.yml', '.yaml']:
+                config, has_env_vars = self._load_with_json_cache(file_path, stat)
+            else:
+                config, has_env_vars = self._parse_config_file(file_path)
+            env_refs = _compile_env_refs(config) if has_env_vars else []
+            with _PARSE_CACHE_LOCK:
+                _PARSE_CACHE[key] = (*stamp, config, env_refs)
+                _PARSE_CACHE.move_to_end(key)
+                if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+                    _PARSE_CACHE.popitem(last=False)
+        
+        return copy.deepcopy(config), env_refs
+    
+    def _load_with_json_cache(self, file_path: Path,
+                              stat: os.stat_result) -> Tuple[Dict[str, Any], bool]:
+        """
+        Load a YAML file through a JSON sidecar cache.
+        
+        The sidecar (``<file>.cache.json``) records the source file's
+        modification time and size and is used only while both match.
+        Configs that do not survive a JSON round trip are not cached.
+        
+        Args:
+            file_path: Path to the YAML configuration file
+            stat: Result of ``os.stat`` for the file
+            
+        Returns:
+            Tuple: Parsed configuration and whether it contains ``${`` references
+        """
+        cache_path = file_path.with_suffix(file_path.suffix + '.cache.json')
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = _loads_json(f.read())
+            if (cached.get('source_mtime_ns') == stat.st_mtime_ns
+                    and cached.get('source_size') == stat.st_size):
+                return cached['config'], cached['has_env_vars']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        
+        config, has_env_vars = self._parse_config_file(file_path)
+        
+        try:
+            payload = json.dumps({
+                'source_mtime_ns': stat.st_mtime_ns,
+                'source_size': stat.st_size,
+                'has_env_vars': has_env_vars,
+                'config': config
+            })
+            # Dates, non-string keys etc. would come back different
+            if json.loads(payload)['config'] != config:
+                return config, has_env_vars
+            
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except (TypeError, ValueError, OSError) as e:
+            self.logger.debug(f"Could not write JSON cache for {file_path}: {str(e)}")
+        
+        return config, has_env_vars
+    
+    def _parse_config_file(self, file_path: Path) -> Tuple[Dict[str, Any], bool]:
+        """Parse a single configuration file, noting whether it has ``${`` references."""
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        has_env_vars = b'${' in raw
+        
+        if file_path.suffix in ['.yml', '.yaml']:
+            # Handle multiple YAML documents
+            configs = list(yaml.load_all(raw, Loader=_YamlLoader))
+            if len(configs) == 1:
+                return configs[0], has_env_vars
             else:
-                raise ValueError(f"Unsupported config file format: {file_path.suffix}")
+                # Merge multiple documents
+                merged_config = {}
+                for config in configs:
+                    if config:
+                        merged_config.update(config)
+                return merged_config, has_env_vars
+        elif file_path.suffix == '.json':
+            return _loads_json(raw), has_env_vars
+        else:
+            raise ValueError(f"Unsupported config file format: {file_path.suffix}")
     
     def get_database_config(self, database_name: str) -> Dict[str, Any]:
         """
@@ -72,25 +319,41 @@ class ConfigManager:
             database_name: Name of the database configuration
             
         Returns:
-            Dict: Database configuration
+            Dict: Database configuration; a shallow copy of the memoized
+                result, so nested values are shared and must be treated as
+                read-only
         """
-        db_configs = self._configs.get('database', {})
+        cached = self._resolved.get(('database', database_name))
+        if cached is not None:
+            return dict(cached)
+        
+        db_configs = self._ensure_loaded('database')
         
         # Try different possible keys
         for key in ['oracle_databases', 'databases']:
             if key in db_configs and database_name in db_configs[key]:
-                config = db_configs[key][database_name].copy()
+                db_config = db_configs[key][database_name]
+                file_refs = self._env_refs.get('database', [])
+                refs = _refs_under(file_refs, (key, database_name))
                 
-                # Apply default configuration if available
+                # Apply default configuration if available (one new dict either way)
                 if 'default_oracle_config' in db_configs:
-                    default_config = db_configs['default_oracle_config'].copy()
-                    default_config.update(config)
-                    config = default_config
+                    config = {**db_configs['default_oracle_config'], **db_config}
+                    refs += [
+                        (path, token)
+                        for path, token in _refs_under(file_refs, ('default_oracle_config',))
+                        if path[0] not in db_config
+                    ]
+                else:
+                    config = dict(db_config)
                 
-                # Resolve environment variables
-                config = self._resolve_environment_variables(config)
+                # Resolve environment variables into one private copy, so the
+                # loaded config is never written to; skipped when there are none
+                if refs:
+                    config = self._resolve_environment_variables(copy.deepcopy(config), refs)
                 
-                return config
+                self._resolved[('database', database_name)] = config
+                return dict(config)
         
         raise ValueError(f"Database configuration '{database_name}' not found")
     
@@ -102,24 +365,27 @@ class ConfigManager:
             job_name: Name of the ETL job
             
         Returns:
-            Dict: Job configuration
+            Dict: Job configuration; a shallow copy of the memoized result,
+                so nested values are shared and must be treated as read-only
         """
-        job_configs = self._configs.get('etl_jobs', {})
+        cached = self._resolved.get(('job', job_name))
+        if cached is not None:
+            return dict(cached)
+        
+        job_configs = self._ensure_loaded('etl_jobs')
         
         # Try different possible keys
         for key in ['oracle_etl_jobs', 'etl_jobs', 'jobs']:
             if key in job_configs and job_name in job_configs[key]:
-                config = job_configs[key][job_name].copy()
-                
-                # Apply global settings if available
+                # Apply global settings if available; job-specific settings
+                # win (one new dict either way)
                 if 'global_settings' in job_configs:
-                    global_settings = job_configs['global_settings'].copy()
-                    # Don't overwrite job-specific settings
-                    for k, v in global_settings.items():
-                        if k not in config:
-                            config[k] = v
+                    config = {**job_configs['global_settings'], **job_configs[key][job_name]}
+                else:
+                    config = dict(job_configs[key][job_name])
                 
-                return config
+                self._resolved[('job', job_name)] = config
+                return dict(config)
         
         raise ValueError(f"Job configuration '{job_name}' not found")
     
@@ -133,43 +399,74 @@ class ConfigManager:
         Returns:
             Dict: Transformation configuration
         """
-        transform_configs = self._configs.get('transformation', {})
+        if self._transform_by_table is None:
+            self._transform_by_table = self._index_transformations()
+        
+        return self._transform_by_table.get(table_name, {})
+    
+    def _index_transformations(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        Index transformation rules by their table name.
+        
+        Returns:
+            Dict: Transformation configuration per table; the first rule
+                found for a table wins, matching the original scan order
+        """
+        transform_configs = self._ensure_loaded('transformation')
+        index = {}
         
-        # Look for table-specific transformations
         for key in ['oracle_transformation_rules', 'transformation_rules', 'transformations']:
             if key in transform_configs:
-                transformations = transform_configs[key]
-                for transform_name, transform_config in transformations.items():
-                    if transform_config.get('table_name') == table_name:
-                        return transform_config
+                for transform_config in transform_configs[key].values():
+                    table_name = transform_config.get('table_name')
+                    if table_name is not None:
+                        index.setdefault(table_name, transform_config)
         
-        return {}
+        return index
     
-    def _resolve_environment_variables(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _resolve_environment_variables(self, config: Dict[str, Any],
+                                       refs: Optional[List[Tuple[tuple, str]]] = None) -> Dict[str, Any]:
         """
         Resolve environment variables in configuration values.
         
+        Values are written into ``config`` in place, so pass a copy the
+        caller owns.
+        
         Args:
             config: Configuration dictionary
+            refs: Precompiled ``(path, token)`` pairs for ``config``
+                (optional, found by walking it otherwise)
             
         Returns:
             Dict: Configuration with resolved environment variables
         """
-        def resolve_value(value):
-            if isinstance(value, str) and value.startswith('${') and value.endswith('}'):
-                env_var = value[2:-1]
-                env_value = os.getenv(env_var)
+        # Each distinct ${VAR} token is looked up (and warned about) once per call
+        environ_get = os.environ.get
+        resolved_tokens = {}
+        
+        def resolve_token(token):
+            resolved = resolved_tokens.get(token)
+            if resolved is None:
+                env_var = token[2:-1]
+                env_value = environ_get(env_var)
                 if env_value is None:
                     self.logger.warning(f"Environment variable {env_var} not found")
-                return env_value or value
-            elif isinstance(value, dict):
-                return {k: resolve_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [resolve_value(item) for item in value]
-            else:
-                return value
+                resolved = resolved_tokens[token] = env_value or token
+            return resolved
+        
+        if not isinstance(config, (dict, list)):
+            return resolve_token(config) if _is_env_ref(config) else config
+        
+        if refs is None:
+            refs = _compile_env_refs(config)
         
-        return resolve_value(config)
+        for path, token in refs:
+            parent = config
+            for key in path[:-1]:
+                parent = parent[key]
+            parent[path[-1]] = resolve_token(token)
+        
+        return config
     
     def get_config(self, config_type: str) -> Dict[str, Any]:
         """
@@ -181,12 +478,17 @@ class ConfigManager:
         Returns:
             Dict: Configuration
         """
-        return self._configs.get(config_type, {})
+        return self._ensure_loaded(config_type)
     
     def reload_configs(self):
         """Reload all configuration files."""
         self._configs.clear()
-        self._load_all_configs()
+        self._env_refs.clear()
+        self._unavailable.clear()
+        self._resolved.clear()
+        self._transform_by_table = None
+        if self.preload:
+            self._load_all_configs()
         self.logger.info("All configurations reloaded")
     
     def validate_database_config(self, config: Dict[str, Any]) -> bool:
@@ -199,9 +501,7 @@ class ConfigManager:
         Returns:
             bool: True if valid
         """
-        required_fields = ['host', 'username', 'password']
-        
-        for field in required_fields:
+        for field in _REQUIRED_DATABASE_FIELDS:
             if field not in config:
                 self.logger.error(f"Missing required database config field: {field}")
                 return False
@@ -232,10 +532,10 @@ class ConfigManager:
             config_type: Type of configuration to update
             updates: Configuration updates
         """
-        if config_type not in self._configs:
-            self._configs[config_type] = {}
-        
-        self._configs[config_type].update(updates)
+        self._configs[config_type] = {**self._ensure_loaded(config_type), **updates}
+        self._env_refs[config_type] = _compile_env_refs(self._configs[config_type])
+        self._resolved.clear()
+        self._transform_by_table = None
         self.logger.info(f"Updated {config_type} configuration")
     
     def save_config(self, config_type: str, file_path: Optional[Path] = None):
@@ -246,25 +546,18 @@ class ConfigManager:
             config_type: Type of configuration to save
             file_path: Path to save file (optional)
         """
+        self._ensure_loaded(config_type)
         if config_type not in self._configs:
             raise ValueError(f"Configuration type '{config_type}' not found")
         
         if file_path is None:
-            config_files = {
-                'database': 'database_configs.yml',
-                'etl_jobs': 'etl_jobs.yml',
-                'logging': 'logging_config.yml',
-                'schedule': 'schedule_config.yml',
-                'transformation': 'transformation_rules.yml'
-            }
-            
-            if config_type not in config_files:
+            if config_type not in self._CONFIG_FILES:
                 raise ValueError(f"Unknown config type: {config_type}")
             
-            file_path = self.config_dir / config_files[config_type]
+            file_path = self.config_dir / self._CONFIG_FILES[config_type]
         
         with open(file_path, 'w') as f:
-            yaml.dump(self._configs[config_type], f, default_flow_style=False)
+            yaml.dump(self._configs[config_type], f, Dumper=_YamlDumper, default_flow_style=False)
         
         self.logger.info(f"Saved {config_type} configuration to {file_path}")
 
@@ -1,12 +1,43 @@
 import base64
 import os
-from cryptography.fernet import Fernet
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import str, bytes
+from functools import lru_cache
 import logging
 
 
+_NONCE_SIZE = 12
+
+
+@lru_cache(maxsize=8)
+def _derive_key(password: str) -> bytes:
+    """Derive a raw 32-byte key from a password, cached per password."""
+    salt = b'etl_framework_salt'  # In production, use a random salt
+    
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    
+    return kdf.derive(password.encode())
+
+
+def _aead_key(master_key: bytes) -> bytes:
+    """Derive a separate ChaCha20-Poly1305 key so the Fernet key is not reused."""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b'etl_framework_chacha20poly1305',
+    ).derive(master_key)
+
+
 class EncryptionUtil:
     """
     Utility class for encrypting and decrypting sensitive data.
@@ -20,22 +51,11 @@ class EncryptionUtil:
         if password is None:
             password = os.getenv('ETL_ENCRYPTION_KEY', 'default-etl-framework-key')
         
-        self.fernet = self._create_fernet(password)
-    
-    def _create_fernet(self, password: str) -> Fernet:
-        """Create Fernet encryption instance from password."""
-        password_bytes = password.encode()
-        salt = b'etl_framework_salt'  # In production, use a random salt
-        
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
+        master_key = _derive_key(password)
+        self.aead = ChaCha20Poly1305(_aead_key(master_key))
         
-        key = base64.urlsafe_b64encode(kdf.derive(password_bytes))
-        return Fernet(key)
+        # Kept only to read values written before the switch to ChaCha20-Poly1305
+        self._legacy_fernet = Fernet(base64.urlsafe_b64encode(master_key))
     
     def encrypt_password(self, password: str) -> str:
         """
@@ -45,11 +65,12 @@ class EncryptionUtil:
             password: Plain text password
             
         Returns:
-            str: Encrypted password (base64 encoded)
+            str: Encrypted password (urlsafe base64 of nonce + ciphertext)
         """
         try:
-            encrypted_bytes = self.fernet.encrypt(password.encode())
-            return base64.urlsafe_b64encode(encrypted_bytes).decode()
+            nonce = os.urandom(_NONCE_SIZE)
+            ciphertext = self.aead.encrypt(nonce, password.encode(), None)
+            return base64.urlsafe_b64encode(nonce + ciphertext).decode('ascii')
         except Exception as e:
             self.logger.error(f"Failed to encrypt password: {str(e)}")
             raise
@@ -59,18 +80,28 @@ class EncryptionUtil:
         Decrypt a password.
         
         Args:
-            encrypted_password: Encrypted password (base64 encoded)
+            encrypted_password: Encrypted password (urlsafe base64 encoded)
             
         Returns:
             str: Plain text password
         """
         try:
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_password.encode())
-            decrypted_bytes = self.fernet.decrypt(encrypted_bytes)
-            return decrypted_bytes.decode()
+            raw = base64.urlsafe_b64decode(encrypted_password.encode('ascii'))
+            try:
+                plaintext = self.aead.decrypt(raw[:_NONCE_SIZE], raw[_NONCE_SIZE:], None)
+                return plaintext.decode()
+            except InvalidTag:
+                return self._legacy_fernet_decrypt(encrypted_password, raw)
         except Exception as e:
             self.logger.error(f"Failed to decrypt password: {str(e)}")
             raise
+    
+    def _legacy_fernet_decrypt(self, encrypted_password: str, raw: bytes) -> str:
+        """Decrypt a Fernet token, either stored as-is or double-base64 encoded."""
+        try:
+            return self._legacy_fernet.decrypt(encrypted_password.encode('ascii')).decode()
+        except InvalidToken:
+            return self._legacy_fernet.decrypt(raw).decode()
 
 
 # Global encryption utility instance
@@ -3,18 +3,52 @@ Centralized logging utility for ETL Framework
 Provides structured logging with different levels, formatters, and handlers
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 import json
 import traceback
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import threading
+import time
 from functools import wraps
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-thread ETL context read by ContextFilter and set via ETLLogger.set_context
+_ctx = threading.local()
+
+_CONTEXT_ATTRS = ('job_id', 'pipeline_id', 'table_name')
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize values json/orjson cannot handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log record dict, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder copes
+            pass
+    return json.dumps(data, default=_json_default)
+
 
 class ETLFormatter(logging.Formatter):
     """Custom formatter for ETL logging with structured output"""
@@ -22,6 +56,7 @@ class ETLFormatter(logging.Formatter):
     def __init__(self, include_extra: bool = True, json_format: bool = False):
         self.include_extra = include_extra
         self.json_format = json_format
+        self._utc = timezone.utc
         
         if json_format:
             super().__init__()
@@ -34,15 +69,8 @@ class ETLFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with ETL-specific information"""
-        
-        # Add ETL-specific context
-        if not hasattr(record, 'job_id'):
-            record.job_id = getattr(threading.current_thread(), 'job_id', 'unknown')
-        if not hasattr(record, 'pipeline_id'):
-            record.pipeline_id = getattr(threading.current_thread(), 'pipeline_id', 'unknown')
-        if not hasattr(record, 'table_name'):
-            record.table_name = getattr(threading.current_thread(), 'table_name', '')
-        
+        # ETL context (job_id, pipeline_id, table_name) is set by ContextFilter,
+        # which every handler from ETLLogger._add_handlers carries
         if self.json_format:
             return self._format_json(record)
         else:
@@ -55,7 +83,7 @@ class ETLFormatter(logging.Formatter):
     def _format_json(self, record: logging.LogRecord) -> str:
         """Format record as JSON"""
         log_data = {
-            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created, tz=self._utc),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -67,19 +95,21 @@ class ETLFormatter(logging.Formatter):
             'table_name': getattr(record, 'table_name', ''),
         }
         
-        # Add exception info if present
-        if record.exc_info:
+        # Add exception info if present; exc_info=True outside an except
+        # block leaves (None, None, None)
+        exc_info = record.exc_info
+        if exc_info and exc_info[0] is not None:
             log_data['exception'] = {
-                'type': record.exc_info[0].__name__,
-                'message': str(record.exc_info[1]),
-                'traceback': traceback.format_exception(*record.exc_info)
+                'type': exc_info[0].__name__,
+                'message': str(exc_info[1]),
+                'traceback': traceback.format_exception(*exc_info)
             }
         
         # Add extra data if present
-        if hasattr(record, 'extra_data'):
+        if 'extra_data' in record.__dict__:
             log_data['extra'] = record.extra_data
         
-        return json.dumps(log_data, default=str)
+        return _dumps(log_data)
 
 
 class ContextFilter(logging.Filter):
@@ -88,10 +118,9 @@ class ContextFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         """Add context information to the record"""
         # Add thread-local context
-        thread = threading.current_thread()
-        record.job_id = getattr(thread, 'job_id', 'unknown')
-        record.pipeline_id = getattr(thread, 'pipeline_id', 'unknown') 
-        record.table_name = getattr(thread, 'table_name', '')
+        record.job_id = getattr(_ctx, 'job_id', 'unknown')
+        record.pipeline_id = getattr(_ctx, 'pipeline_id', 'unknown')
+        record.table_name = getattr(_ctx, 'table_name', '')
         
         # Add process information
         record.process_id = os.getpid()
@@ -100,10 +129,25 @@ class ContextFilter(logging.Filter):
         return True
 
 
+class _ETLQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps exc_info on the queued record so ETLFormatter
+    can still emit structured exception data on the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message without pre-formatting the record"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class ETLLogger:
     """Centralized logger for ETL operations"""
     
     _loggers: Dict[str, logging.Logger] = {}
+    _listeners: List[logging.handlers.QueueListener] = []
     _configured: bool = False
     _lock = threading.Lock()
     
@@ -160,6 +204,8 @@ class ETLLogger:
             console_handler.addFilter(ContextFilter())
             logger.addHandler(console_handler)
         
+        file_handlers = []
+        
         # File handler for general logs
         if config.get('file_logging', True):
             log_file = os.path.join(config.get('log_dir', './logs'), 'etl_framework.log')
@@ -176,8 +222,7 @@ class ETLLogger:
                 json_format=config.get('file_json', False)
             )
             file_handler.setFormatter(file_formatter)
-            file_handler.addFilter(ContextFilter())
-            logger.addHandler(file_handler)
+            file_handlers.append(file_handler)
         
         # Error file handler
         if config.get('error_logging', True):
@@ -195,8 +240,9 @@ class ETLLogger:
                 json_format=config.get('error_json', True)
             )
             error_handler.setFormatter(error_formatter)
-            error_handler.addFilter(ContextFilter())
-            logger.addHandler(error_handler)
+            file_handlers.append(error_handler)
+        
+        cls._attach_file_handlers(logger, file_handlers, config)
         
         # Performance log handler
         if config.get('performance_logging', True):
@@ -211,14 +257,53 @@ class ETLLogger:
             perf_handler.setLevel(logging.INFO)
             perf_formatter = ETLFormatter(json_format=True)
             perf_handler.setFormatter(perf_formatter)
-            perf_handler.addFilter(ContextFilter())
             
             # Create performance logger
             perf_logger = logging.getLogger('performance')
-            perf_logger.addHandler(perf_handler)
+            cls._attach_file_handlers(perf_logger, [perf_handler], config)
             perf_logger.setLevel(logging.INFO)
             perf_logger.propagate = False
     
+    @classmethod
+    def _attach_file_handlers(cls, logger: logging.Logger,
+                              handlers: List[logging.Handler],
+                              config: Dict[str, Any]) -> None:
+        """
+        Attach file handlers to logger, behind a queue when async file
+        logging is enabled so formatting and disk I/O run on a listener
+        thread instead of the logging caller.
+        """
+        if not handlers:
+            return
+        
+        if not config.get('async_file_logging', True):
+            for handler in handlers:
+                handler.addFilter(ContextFilter())
+                logger.addHandler(handler)
+            return
+        
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        
+        if not cls._listeners:
+            atexit.register(cls._stop_listeners)
+        cls._listeners.append(listener)
+        
+        # Context is thread-local, so it must be captured on the caller's
+        # thread before the record is queued
+        queue_handler = _ETLQueueHandler(log_queue)
+        queue_handler.addFilter(ContextFilter())
+        logger.addHandler(queue_handler)
+    
+    @classmethod
+    def _stop_listeners(cls) -> None:
+        """Flush queued records and stop all queue listeners"""
+        while cls._listeners:
+            cls._listeners.pop().stop()
+    
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """Get or create a logger with the given name"""
@@ -231,75 +316,73 @@ class ETLLogger:
     @classmethod
     def set_context(cls, **kwargs) -> None:
         """Set context for current thread"""
-        thread = threading.current_thread()
         for key, value in kwargs.items():
-            setattr(thread, key, value)
+            setattr(_ctx, key, value)
     
     @classmethod
     def clear_context(cls) -> None:
         """Clear context for current thread"""
-        thread = threading.current_thread()
-        for attr in ['job_id', 'pipeline_id', 'table_name']:
-            if hasattr(thread, attr):
-                delattr(thread, attr)
+        for attr in _CONTEXT_ATTRS:
+            if hasattr(_ctx, attr):
+                delattr(_ctx, attr)
+
+
+def _log_performance(perf_logger: logging.Logger, func, execution_time: float,
+                     error: Optional[Exception] = None) -> None:
+    """Record a function execution to the performance logger"""
+    level = logging.INFO if error is None else logging.ERROR
+    if not perf_logger.isEnabledFor(level):
+        return
+    
+    extra_data = {
+        'function': func.__name__,
+        'module': func.__module__,
+        'execution_time_seconds': execution_time,
+        'status': 'success' if error is None else 'failed'
+    }
+    if error is not None:
+        extra_data['error'] = str(error)
+    
+    perf_logger.log(
+        level,
+        "Function execution" if error is None else "Function execution failed",
+        extra={'extra_data': extra_data}
+    )
 
 
 def log_execution_time(logger: Optional[logging.Logger] = None):
     """Decorator to log function execution time"""
     def decorator(func):
+        func_logger = logger or ETLLogger.get_logger(f"{func.__module__}.{func.__name__}")
+        perf_logger = logging.getLogger('performance')
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = datetime.now()
-            func_logger = logger or ETLLogger.get_logger(f"{func.__module__}.{func.__name__}")
+            start_time = time.perf_counter()
             
             try:
                 func_logger.info(f"Starting execution of {func.__name__}")
                 result = func(*args, **kwargs)
-                execution_time = (datetime.now() - start_time).total_seconds()
+                execution_time = time.perf_counter() - start_time
                 
                 func_logger.info(
                     f"Completed {func.__name__}",
                     extra={'extra_data': {'execution_time_seconds': execution_time}}
                 )
                 
-                # Log to performance logger
-                perf_logger = logging.getLogger('performance')
-                perf_logger.info(
-                    f"Function execution",
-                    extra={
-                        'extra_data': {
-                            'function': func.__name__,
-                            'module': func.__module__,
-                            'execution_time_seconds': execution_time,
-                            'status': 'success'
-                        }
-                    }
-                )
+                _log_performance(perf_logger, func, execution_time)
                 
                 return result
                 
             except Exception as e:
-                execution_time = (datetime.now() - start_time).total_seconds()
+                execution_time = time.perf_counter() - start_time
                 func_logger.error(
                     f"Error in {func.__name__}: {str(e)}",
                     extra={'extra_data': {'execution_time_seconds': execution_time}},
                     exc_info=True
                 )
                 
-                # Log to performance logger
-                perf_logger = logging.getLogger('performance')
-                perf_logger.error(
-                    f"Function execution failed",
-                    extra={
-                        'extra_data': {
-                            'function': func.__name__,
-                            'module': func.__module__,
-                            'execution_time_seconds': execution_time,
-                            'status': 'failed',
-                            'error': str(e)
-                        }
-                    }
-                )
+                _log_performance(perf_logger, func, execution_time, e)
                 
                 raise
         
@@ -309,18 +392,23 @@ def log_execution_time(logger: Optional[logging.Logger] = None):
 
 def log_method(logger: Optional[logging.Logger] = None, level: str = 'INFO'):
     """Decorator to log method entry and exit"""
+    log_level = getattr(logging, level.upper())
+    
     def decorator(func):
+        func_logger = logger or ETLLogger.get_logger(f"{func.__module__}.{func.__qualname__}")
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            func_logger = logger or ETLLogger.get_logger(f"{func.__module__}.{func.__qualname__}")
-            log_level = getattr(logging, level.upper())
+            enabled = func_logger.isEnabledFor(log_level)
             
             # Log entry
-            func_logger.log(log_level, f"Entering {func.__qualname__}")
+            if enabled:
+                func_logger.log(log_level, "Entering %s", func.__qualname__)
             
             try:
                 result = func(*args, **kwargs)
-                func_logger.log(log_level, f"Exiting {func.__qualname__}")
+                if enabled:
+                    func_logger.log(log_level, "Exiting %s", func.__qualname__)
                 return result
             except Exception as e:
                 func_logger.error(f"Exception in {func.__qualname__}: {str(e)}", exc_info=True)
@@ -335,27 +423,37 @@ class LoggerMixin:
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class"""
-        if not hasattr(self, '_logger'):
+        try:
+            return self._logger
+        except AttributeError:
             self._logger = ETLLogger.get_logger(f"{self.__class__.__module__}.{self.__class__.__name__}")
-        return self._logger
+            return self._logger
     
     def log_info(self, message: str, **kwargs) -> None:
         """Log info message with optional extra data"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         extra = {'extra_data': kwargs} if kwargs else None
         self.logger.info(message, extra=extra)
     
     def log_error(self, message: str, exception: Optional[Exception] = None, **kwargs) -> None:
         """Log error message with optional exception and extra data"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         extra = {'extra_data': kwargs} if kwargs else None
         self.logger.error(message, extra=extra, exc_info=exception)
     
     def log_warning(self, message: str, **kwargs) -> None:
         """Log warning message with optional extra data"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         extra = {'extra_data': kwargs} if kwargs else None
         self.logger.warning(message, extra=extra)
     
     def log_debug(self, message: str, **kwargs) -> None:
         """Log debug message with optional extra data"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         extra = {'extra_data': kwargs} if kwargs else None
         self.logger.debug(message, extra=extra)
 
@@ -377,6 +475,7 @@ def get_default_config() -> Dict[str, Any]:
         'file_level': 'DEBUG',
         'file_include_extra': True,
         'file_json': False,
+        'async_file_logging': True,
         'error_logging': True,
         'error_json': True,
         'performance_logging': True,
@@ -403,7 +502,6 @@ if __name__ == "__main__":
     # Test decorator
     @log_execution_time(logger)
     def test_function():
-        import time
         time.sleep(1)
         return "success"
     
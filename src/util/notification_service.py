@@ -1,11 +1,140 @@
 import smtplib
+import hashlib
 import json
 import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from email.message import EmailMessage
+from typing import List, Dict, Any, Optional, Tuple
 import logging
-from datetime import datetime
+import queue
+import random
+import threading
+import time
+from collections import ChainMap, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from enum import IntEnum
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Webhook payload fields that differ on every send and so are left out of
+# the dedup key
+_VOLATILE_WEBHOOK_FIELDS = frozenset({'timestamp'})
+
+# Email bodies for job notifications, filled with str.format_map
+_JOB_SUCCESS_TEMPLATE = (
+    "ETL Job '{job_name}' completed successfully.\n"
+    "\n"
+    "Job Details:\n"
+    "- Start Time: {start_time}\n"
+    "- End Time: {end_time}\n"
+    "- Duration: {duration}\n"
+    "- Rows Processed: {rows_processed}\n"
+    "- Tables Processed: {tables_processed}\n"
+    "\n"
+    "Status: SUCCESS"
+)
+
+_JOB_FAILURE_TEMPLATE = (
+    "ETL Job '{job_name}' FAILED.\n"
+    "\n"
+    "Error Message:\n"
+    "{error_message}\n"
+    "\n"
+    "Job Details:\n"
+    "- Start Time: {start_time}\n"
+    "- Failure Time: {failure_time}\n"
+    "- Duration: {duration}\n"
+    "- Rows Processed: {rows_processed}\n"
+    "\n"
+    "Status: FAILED\n"
+    "\n"
+    "Please check the logs for more details."
+)
+
+# Shown for any job detail the caller did not provide
+_JOB_DETAIL_DEFAULTS = {
+    'start_time': 'Unknown',
+    'end_time': 'Unknown',
+    'failure_time': 'Unknown',
+    'duration': 'Unknown',
+    'rows_processed': 'Unknown',
+    'tables_processed': 'Unknown',
+}
+
+
+class NotifyStatus(IntEnum):
+    """
+    Outcome of a single-channel send. FAILED is falsy, so callers that only
+    test the result for truth keep working; SKIPPED covers sends that were
+    deliberately not made (duplicate, rate limited, channel not configured).
+    """
+    FAILED = 0
+    SENT = 1
+    SKIPPED = 2
+
+
+@lru_cache(maxsize=128)
+def _join_recipients(recipients: Tuple[str, ...]) -> str:
+    """Format a recipient list for the To header; most sends reuse a few lists."""
+    return ', '.join(recipients)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given as delay seconds or an HTTP-date.
+    
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize values json/orjson cannot handle natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _json_bytes(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option)
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder copes
+            pass
+    return json.dumps(
+        obj, default=_json_default, sort_keys=sort_keys, indent=2 if indent else None
+    ).encode()
+
 
 class NotificationService:
     """
@@ -24,15 +153,323 @@ class NotificationService:
         self.smtp_password = self.config.get('smtp_password')
         self.from_email = self.config.get('from_email', 'etl@company.com')
         
+        # Persistent SMTP connection, opened on first use and shared by callers
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        self.smtp_chunk_size = self.config.get('smtp_chunk_size', 100)
+        # Socket timeout so a silently dropped idle connection fails the
+        # NOOP probe quickly instead of blocking every sender on the lock
+        self.smtp_timeout = self.config.get('smtp_timeout', 10)
+        
         # Slack configuration
         self.slack_webhook_url = self.config.get('slack_webhook_url')
         self.slack_channel = self.config.get('slack_channel', '#etl-alerts')
+        self._slack_base = {'channel': self.slack_channel, 'username': 'ETL Framework'}
         
         # Webhook configuration
         self.webhook_urls = self.config.get('webhook_urls', [])
+        
+        # Shared HTTP session so Slack/webhook calls reuse keep-alive connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.get('http_pool_connections', 8),
+            pool_maxsize=self.config.get('http_pool_maxsize', 32)
+        )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        
+        # Retries for transient Slack/webhook failures (5xx, 429, network errors)
+        self.http_max_retries = self.config.get('http_max_retries', 3)
+        self.http_retry_base_delay = self.config.get('http_retry_base_delay', 1.0)
+        self.http_retry_max_delay = self.config.get('http_retry_max_delay', 30.0)
+        
+        # Per-attempt (connect, read) timeouts and a deadline across all attempts
+        self._http_timeout = (self.config.get('connect_timeout', 3), self.config.get('read_timeout', 7))
+        self._total_deadline = self.config.get('notify_deadline_s', 20)
+        
+        # Per-URL circuit breaker: after webhook_breaker_threshold consecutive
+        # failures a URL is skipped for webhook_breaker_cooldown seconds
+        self.webhook_breaker_threshold = self.config.get('webhook_breaker_threshold', 5)
+        self.webhook_breaker_cooldown = self.config.get('webhook_breaker_cooldown', 60)
+        self._breaker: Dict[str, Dict[str, float]] = {}
+        self._breaker_lock = threading.Lock()
+        
+        # Workers for overlapping email/Slack/webhook sends; threads start on demand
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.get('notify_workers', 4),
+            thread_name_prefix='notify'
+        )
+        
+        # Queue drained by a background worker for the non-blocking send_*_async
+        # methods; the worker thread starts on first use
+        self._queue: queue.Queue = queue.Queue(maxsize=self.config.get('notify_queue_size', 10_000))
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        
+        # Digests of recently sent payloads -> send time, oldest first;
+        # identical sends within the TTL are suppressed (0 disables). The
+        # TTL is sized for retry storms, not for separate runs of a job
+        self._dedup_ttl = self.config.get('dedup_ttl_seconds', 300)
+        self._recent: OrderedDict = OrderedDict()
+        self._recent_lock = threading.Lock()
+        
+        # Rate limit for Slack/webhook pushes: at most push_rate_limit per
+        # minute, and one low-priority push per thread key (job name) per
+        # push_dedup_window seconds; high-impact pushes are never held back
+        self.push_rate_limit = self.config.get('push_rate_limit', 30)
+        self.push_dedup_window = self.config.get('push_dedup_window', 60)
+        self._push_times: deque = deque()
+        self._push_by_key: Dict[Tuple[str, str], float] = {}
+        self._push_lock = threading.Lock()
+    
+    def close(self):
+        """Send queued notifications, wait for in-flight sends and close pooled network connections."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+        
+        self._executor.shutdown(wait=True)
+        self._http.close()
+        
+        with self._smtp_lock:
+            self._close_smtp()
+    
+    def _enqueue(self, func, *args, **kwargs) -> bool:
+        """
+        Queue a send for the background worker.
+        
+        Returns:
+            bool: True if queued, False if the queue is full
+        """
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._drain, name='notify-queue', daemon=True)
+                self._worker.start()
+        
+        try:
+            self._queue.put_nowait((func, args, kwargs))
+            return True
+        except queue.Full:
+            self.logger.error("Notification queue full, dropping %s", func.__name__)
+            return False
+    
+    def _drain(self):
+        """Run queued sends until the stop sentinel is received."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                func, args, kwargs = item
+                func(*args, **kwargs)
+            except Exception as e:
+                self.logger.error("Queued notification failed: %s", e)
+            finally:
+                self._queue.task_done()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued notifications to be sent.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            bool: True if the queue drained within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if deadline is None:
+                    self._queue.all_tasks_done.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._queue.all_tasks_done.wait(remaining)
+        
+        return True
+    
+    def send_email_async(self, to_emails: List[str], subject: str,
+                         message: str, html_message: Optional[str] = None) -> bool:
+        """Queue send_email on the background worker; returns False if the queue is full."""
+        return self._enqueue(self.send_email, to_emails, subject, message, html_message)
+    
+    def send_slack_notification_async(self, message: str, channel: Optional[str] = None) -> bool:
+        """Queue send_slack_notification on the background worker."""
+        return self._enqueue(self.send_slack_notification, message, channel)
+    
+    def send_webhook_notification_async(self, data: Dict[str, Any]) -> bool:
+        """Queue send_webhook_notification on the background worker."""
+        return self._enqueue(self.send_webhook_notification, data)
+    
+    def send_job_success_notification_async(self, job_name: str, recipients: List[str],
+                                            job_details: Optional[Dict] = None) -> bool:
+        """Queue send_job_success_notification on the background worker."""
+        return self._enqueue(self.send_job_success_notification, job_name, recipients, job_details)
+    
+    def send_job_failure_notification_async(self, job_name: str, recipients: List[str],
+                                            error_message: str,
+                                            job_details: Optional[Dict] = None) -> bool:
+        """Queue send_job_failure_notification on the background worker."""
+        return self._enqueue(self.send_job_failure_notification, job_name, recipients,
+                             error_message, job_details)
+    
+    def send_error_notification_async(self, subject: str, message: str,
+                                      error_details: Optional[Dict] = None) -> bool:
+        """Queue send_error_notification on the background worker."""
+        return self._enqueue(self.send_error_notification, subject, message, error_details)
+    
+    def _is_duplicate(self, key_bytes: bytes) -> bool:
+        """
+        Check whether an identical payload was sent within the dedup TTL,
+        recording it as sent if not.
+        
+        Args:
+            key_bytes: Serialized payload identifying the notification
+            
+        Returns:
+            bool: True if the notification should be suppressed
+        """
+        if not self._dedup_ttl:
+            return False
+        
+        digest = hashlib.md5(key_bytes, usedforsecurity=False).digest()
+        now = time.monotonic()
+        
+        with self._recent_lock:
+            cutoff = now - self._dedup_ttl
+            while self._recent and next(iter(self._recent.values())) < cutoff:
+                self._recent.popitem(last=False)
+            
+            if digest in self._recent:
+                return True
+            
+            self._recent[digest] = now
+            return False
+    
+    def _allow_push(self, channel: str, high_impact: bool, thread_key: Optional[str]) -> bool:
+        """
+        Apply the push rate limit and per-thread-key window.
+        
+        Args:
+            channel: Push channel ('slack' or 'webhook'); windows are per channel
+            high_impact: Failure/error pushes, which bypass suppression
+            thread_key: Key grouping related pushes, e.g. the job name
+            
+        Returns:
+            bool: True if the push may be sent (and is counted)
+        """
+        now = time.monotonic()
+        
+        with self._push_lock:
+            cutoff = now - 60
+            while self._push_times and self._push_times[0] < cutoff:
+                self._push_times.popleft()
+            
+            key = (channel, thread_key) if thread_key else None
+            
+            if not high_impact:
+                if len(self._push_times) >= self.push_rate_limit:
+                    return False
+                last_sent = self._push_by_key.get(key) if key else None
+                if last_sent is not None and last_sent > now - self.push_dedup_window:
+                    return False
+            
+            self._push_times.append(now)
+            if key:
+                if len(self._push_by_key) >= 1024:
+                    window_start = now - self.push_dedup_window
+                    self._push_by_key = {
+                        k: t for k, t in self._push_by_key.items() if t > window_start
+                    }
+                self._push_by_key[key] = now
+            return True
+    
+    def _forget_sent(self, key_bytes: bytes):
+        """Drop a payload from the dedup cache so a failed send can be retried."""
+        if not self._dedup_ttl:
+            return
+        
+        digest = hashlib.md5(key_bytes, usedforsecurity=False).digest()
+        with self._recent_lock:
+            self._recent.pop(digest, None)
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Get the shared SMTP connection, reconnecting if it has gone stale.
+        
+        Must be called with ``_smtp_lock`` held.
+        
+        Returns:
+            smtplib.SMTP: Connected (and authenticated, if configured) client
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.smtp_timeout)
+        try:
+            if self.smtp_username and self.smtp_password:
+                server.starttls()
+                server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        return server
+    
+    def _close_smtp(self):
+        """Drop the shared SMTP connection. Must be called with ``_smtp_lock`` held."""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+    
+    def _send_message_locked(self, msg: EmailMessage):
+        """
+        Send over the shared connection; retry once on a fresh connection if
+        the server dropped it between the probe and the send.
+        
+        Must be called with ``_smtp_lock`` held.
+        """
+        try:
+            self._get_smtp().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self._close_smtp()
+            self._get_smtp().send_message(msg)
+    
+    def _build_message(self, to_emails: List[str], subject: str,
+                       message: str, html_message: Optional[str] = None) -> EmailMessage:
+        """Build the message for an email notification."""
+        msg = EmailMessage()
+        # Header values may not contain line breaks; subjects built from
+        # exception text often do
+        msg['Subject'] = ' '.join(subject.splitlines())
+        msg['From'] = self.from_email
+        msg['To'] = _join_recipients(tuple(to_emails))
+        
+        # Plain text body, plus an HTML alternative if provided
+        msg.set_content(message)
+        if html_message:
+            msg.add_alternative(html_message, subtype='html')
+        
+        return msg
     
     def send_email(self, to_emails: List[str], subject: str, 
-                  message: str, html_message: Optional[str] = None) -> bool:
+                  message: str, html_message: Optional[str] = None) -> NotifyStatus:
         """
         Send email notification.
         
@@ -43,113 +480,292 @@ class NotificationService:
             html_message: HTML message (optional)
             
         Returns:
-            bool: True if successful
+            NotifyStatus: SENT, SKIPPED for a duplicate, or FAILED
         """
+        dedup_key = json.dumps(['email', to_emails, subject, message, html_message]).encode()
+        if self._is_duplicate(dedup_key):
+            self.logger.debug("Suppressed duplicate email: %s", subject)
+            return NotifyStatus.SKIPPED
+        
         try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.from_email
-            msg['To'] = ', '.join(to_emails)
-            
-            # Add plain text part
-            text_part = MIMEText(message, 'plain')
-            msg.attach(text_part)
+            msg = self._build_message(to_emails, subject, message, html_message)
             
-            # Add HTML part if provided
-            if html_message:
-                html_part = MIMEText(html_message, 'html')
-                msg.attach(html_part)
+            with self._smtp_lock:
+                self._send_message_locked(msg)
             
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.smtp_username and self.smtp_password:
-                    server.starttls()
-                    server.login(self.smtp_username, self.smtp_password)
-                
-                server.send_message(msg)
-            
-            self.logger.info(f"Email sent successfully to {', '.join(to_emails)}")
-            return True
+            self.logger.info("Email sent successfully to %s", msg['To'])
+            return NotifyStatus.SENT
             
         except Exception as e:
-            self.logger.error(f"Failed to send email: {str(e)}")
-            return False
+            self.logger.error("Failed to send email: %s", e)
+            self._forget_sent(dedup_key)
+            return NotifyStatus.FAILED
     
-    def send_slack_notification(self, message: str, channel: Optional[str] = None) -> bool:
+    def send_emails_batch(self, messages: List[Tuple[List[str], str, str]]) -> bool:
+        """
+        Send many emails over one SMTP session.
+        
+        Messages are sent in chunks of ``smtp_chunk_size``, reconnecting
+        between chunks to stay within per-connection limits of the server.
+        A failed message is logged and does not stop the rest of the batch.
+        
+        Args:
+            messages: List of (recipients, subject, message) tuples
+            
+        Returns:
+            bool: True if every message was sent
+        """
+        success = True
+        chunk_size = max(1, self.smtp_chunk_size)
+        
+        with self._smtp_lock:
+            for start in range(0, len(messages), chunk_size):
+                if start:
+                    self._close_smtp()
+                
+                for to_emails, subject, message in messages[start:start + chunk_size]:
+                    try:
+                        self._send_message_locked(self._build_message(to_emails, subject, message))
+                    except Exception as e:
+                        self.logger.error("Failed to send email to %s: %s", ', '.join(to_emails), e)
+                        success = False
+        
+        self.logger.info("Processed batch of %s emails", len(messages))
+        return success
+    
+    def send_slack_notification(self, message: str, channel: Optional[str] = None,
+                                high_impact: bool = True,
+                                thread_key: Optional[str] = None) -> NotifyStatus:
         """
         Send Slack notification.
         
         Args:
             message: Message to send
             channel: Slack channel (optional, uses default if not provided)
+            high_impact: Bypass the push rate limit (default for direct calls)
+            thread_key: Key for the per-key push window, e.g. the job name
             
         Returns:
-            bool: True if successful
+            NotifyStatus: SENT, SKIPPED (not configured, duplicate or rate
+                limited), or FAILED
         """
         if not self.slack_webhook_url:
             self.logger.warning("Slack webhook URL not configured")
-            return False
+            return NotifyStatus.SKIPPED
+        
+        if channel:
+            payload = {**self._slack_base, 'channel': channel, 'text': message}
+        else:
+            payload = {**self._slack_base, 'text': message}
+        
+        # Serialized once with sorted keys: the same bytes are the request
+        # body and the dedup key
+        body = _json_bytes(payload, sort_keys=True)
+        dedup_key = b'slack:' + body
+        if self._is_duplicate(dedup_key):
+            self.logger.debug("Suppressed duplicate Slack notification")
+            return NotifyStatus.SKIPPED
+        
+        if not self._allow_push('slack', high_impact, thread_key):
+            self.logger.debug("Slack notification held back by rate limit")
+            self._forget_sent(dedup_key)
+            return NotifyStatus.SKIPPED
         
         try:
-            payload = {
-                'text': message,
-                'channel': channel or self.slack_channel,
-                'username': 'ETL Framework'
-            }
-            
-            response = requests.post(
-                self.slack_webhook_url,
-                json=payload,
-                timeout=10
-            )
+            response = self._post_with_retry(self.slack_webhook_url, body)
             
             if response.status_code == 200:
                 self.logger.info("Slack notification sent successfully")
-                return True
+                return NotifyStatus.SENT
             else:
-                self.logger.error(f"Slack notification failed: {response.status_code}")
-                return False
+                self.logger.error("Slack notification failed: %s", response.status_code)
+                self._forget_sent(dedup_key)
+                return NotifyStatus.FAILED
                 
         except Exception as e:
-            self.logger.error(f"Failed to send Slack notification: {str(e)}")
-            return False
+            self.logger.error("Failed to send Slack notification: %s", e)
+            self._forget_sent(dedup_key)
+            return NotifyStatus.FAILED
     
-    def send_webhook_notification(self, data: Dict[str, Any]) -> bool:
+    def send_webhook_notification(self, data: Dict[str, Any], high_impact: bool = True,
+                                  thread_key: Optional[str] = None) -> NotifyStatus:
         """
         Send webhook notification.
         
         Args:
             data: Data to send in webhook
+            high_impact: Bypass the push rate limit (default for direct calls)
+            thread_key: Key for the per-key push window, e.g. the job name
             
         Returns:
-            bool: True if all webhooks successful
+            NotifyStatus: SENT if every URL accepted it, SKIPPED (no URLs,
+                duplicate or rate limited), or FAILED
         """
         if not self.webhook_urls:
             self.logger.warning("No webhook URLs configured")
-            return True
+            return NotifyStatus.SKIPPED
         
-        success = True
+        # Serialized once for every URL and retry, and reused as the dedup
+        # key unless it carries fields such as the send timestamp
+        try:
+            body = _json_bytes(data, sort_keys=True)
+            if isinstance(data, dict) and not _VOLATILE_WEBHOOK_FIELDS.isdisjoint(data):
+                stable = {k: v for k, v in data.items() if k not in _VOLATILE_WEBHOOK_FIELDS}
+                dedup_key = b'webhook:' + _json_bytes(stable, sort_keys=True)
+            else:
+                dedup_key = b'webhook:' + body
+        except (TypeError, ValueError) as e:
+            self.logger.error("Failed to serialize webhook payload: %s", e)
+            return NotifyStatus.FAILED
         
-        for webhook_url in self.webhook_urls:
-            try:
-                response = requests.post(
-                    webhook_url,
-                    json=data,
-                    timeout=10
-                )
-                
-                if response.status_code in [200, 201, 202]:
-                    self.logger.info(f"Webhook notification sent to {webhook_url}")
-                else:
-                    self.logger.error(f"Webhook failed for {webhook_url}: {response.status_code}")
-                    success = False
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to send webhook to {webhook_url}: {str(e)}")
+        if self._is_duplicate(dedup_key):
+            self.logger.debug("Suppressed duplicate webhook notification")
+            return NotifyStatus.SKIPPED
+        
+        if not self._allow_push('webhook', high_impact, thread_key):
+            self.logger.debug("Webhook notification held back by rate limit")
+            self._forget_sent(dedup_key)
+            return NotifyStatus.SKIPPED
+        
+        if len(self.webhook_urls) == 1:
+            success = self._send_webhook(self.webhook_urls[0], body)
+        else:
+            # POST to every subscriber concurrently so one slow URL does not
+            # delay the others
+            futures = [
+                self._executor.submit(self._send_webhook, webhook_url, body)
+                for webhook_url in self.webhook_urls
+            ]
+            success = all([future.result() for future in futures])
+        
+        if not success:
+            self._forget_sent(dedup_key)
+            return NotifyStatus.FAILED
+        return NotifyStatus.SENT
+    
+    def _send_webhook(self, webhook_url: str, body: bytes) -> bool:
+        """POST a serialized payload to a single webhook URL, unless its circuit is open."""
+        with self._breaker_lock:
+            state = self._breaker.setdefault(webhook_url, {'fails': 0, 'open_until': 0.0})
+            if time.monotonic() < state['open_until']:
+                self.logger.warning("Skipping webhook %s: circuit open", webhook_url)
+                return False
+        
+        try:
+            response = self._post_with_retry(webhook_url, body)
+            
+            if response.status_code in [200, 201, 202]:
+                self.logger.info("Webhook notification sent to %s", webhook_url)
+                success = True
+            else:
+                self.logger.error("Webhook failed for %s: %s", webhook_url, response.status_code)
                 success = False
+                
+        except Exception as e:
+            self.logger.error("Failed to send webhook to %s: %s", webhook_url, e)
+            success = False
+        
+        with self._breaker_lock:
+            if success:
+                state['fails'] = 0
+            else:
+                state['fails'] += 1
+                if state['fails'] >= self.webhook_breaker_threshold:
+                    state['open_until'] = time.monotonic() + self.webhook_breaker_cooldown
+                    self.logger.warning(
+                        "Opened circuit for webhook %s after %s failures", webhook_url, state['fails']
+                    )
         
         return success
     
+    def _post_with_retry(self, url: str, body: bytes) -> requests.Response:
+        """
+        POST JSON, retrying 5xx/429 responses and network errors with
+        capped exponential backoff plus jitter. A Retry-After header on a
+        429/503 response is honoured instead, bounded by the max delay.
+        Other 4xx responses are returned immediately since repeating them
+        cannot succeed. No retry is started that would sleep past the
+        total notify deadline.
+        
+        Args:
+            url: Target URL
+            body: Serialized JSON body
+            
+        Returns:
+            requests.Response: The last response received
+        """
+        base = self.http_retry_base_delay
+        start = time.monotonic()
+        
+        for attempt in range(self.http_max_retries + 1):
+            retry_after = None
+            error = None
+            try:
+                response = self._http.post(url, data=body, headers=_JSON_HEADERS,
+                                           timeout=self._http_timeout)
+                if response.status_code < 500 and response.status_code != 429:
+                    return response
+                if response.status_code in (429, 503):
+                    retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                response, error = None, e
+            
+            if retry_after is not None:
+                delay = min(self.http_retry_max_delay, retry_after)
+            else:
+                delay = min(self.http_retry_max_delay, base * (2 ** attempt)) + random.uniform(0, base * 0.25)
+            
+            if (attempt == self.http_max_retries
+                    or time.monotonic() - start + delay > self._total_deadline):
+                if error is not None:
+                    raise error
+                return response
+            
+            self.logger.debug("Retrying POST to %s in %.2fs (attempt %s)", url, delay, attempt + 1)
+            time.sleep(delay)
+    
+    def _fan_out(self, recipients: List[str], subject: str, message: str,
+                 slack_message: Optional[str], webhook_data: Optional[Dict[str, Any]],
+                 high_impact: bool, thread_key: Optional[str] = None) -> bool:
+        """
+        Send one notification by email, Slack and webhook concurrently.
+        
+        Email and Slack run on the executor; webhooks are dispatched from the
+        calling thread, which submits its own per-URL tasks, so no worker
+        ever blocks waiting on another worker.
+        
+        Args:
+            slack_message: Slack text, or None when Slack is not configured
+            webhook_data: Webhook payload, or None when no webhooks are configured
+            high_impact: Whether Slack/webhook pushes bypass the rate limit
+            thread_key: Key for the per-key push window, e.g. the job name
+        
+        Returns:
+            bool: True unless a channel FAILED; skipped channels do not count
+                as failures
+        """
+        email_future = self._executor.submit(self.send_email, recipients, subject, message)
+        
+        slack_future = None
+        if slack_message is not None:
+            slack_future = self._executor.submit(
+                self.send_slack_notification, slack_message,
+                high_impact=high_impact, thread_key=thread_key
+            )
+        
+        # Unconfigured channels are skipped, as the send_* methods report them
+        results = [NotifyStatus.SKIPPED, NotifyStatus.SKIPPED]
+        if webhook_data is not None:
+            results[0] = self.send_webhook_notification(
+                webhook_data, high_impact=high_impact, thread_key=thread_key
+            )
+        
+        if slack_future is not None:
+            results[1] = slack_future.result()
+        results.append(email_future.result())
+        
+        return all(status != NotifyStatus.FAILED for status in results)
+    
     def send_job_success_notification(self, job_name: str, 
                                     recipients: List[str],
                                     job_details: Optional[Dict] = None) -> bool:
@@ -168,36 +784,25 @@ class NotificationService:
         
         # Build message
         details = job_details or {}
-        message = f"""
-ETL Job '{job_name}' completed successfully.
-
-Job Details:
-- Start Time: {details.get('start_time', 'Unknown')}
-- End Time: {details.get('end_time', 'Unknown')}
-- Duration: {details.get('duration', 'Unknown')}
-- Rows Processed: {details.get('rows_processed', 'Unknown')}
-- Tables Processed: {details.get('tables_processed', 'Unknown')}
-
-Status: SUCCESS
-        """.strip()
-        
-        # Send email
-        email_success = self.send_email(recipients, subject, message)
-        
-        # Send Slack notification
-        slack_message = f"✅ ETL Job Success: {job_name} completed successfully"
-        slack_success = self.send_slack_notification(slack_message)
-        
-        # Send webhook
-        webhook_data = {
-            'event_type': 'job_success',
-            'job_name': job_name,
-            'timestamp': datetime.now().isoformat(),
-            'details': details
-        }
-        webhook_success = self.send_webhook_notification(webhook_data)
-        
-        return email_success and slack_success and webhook_success
+        message = _JOB_SUCCESS_TEMPLATE.format_map(
+            ChainMap({'job_name': job_name}, details, _JOB_DETAIL_DEFAULTS)
+        )
+        
+        slack_message = None
+        if self.slack_webhook_url:
+            slack_message = f"✅ ETL Job Success: {job_name} completed successfully"
+        
+        webhook_data = None
+        if self.webhook_urls:
+            webhook_data = {
+                'event_type': 'job_success',
+                'job_name': job_name,
+                'timestamp': datetime.now().isoformat(),
+                'details': details
+            }
+        
+        return self._fan_out(recipients, subject, message, slack_message, webhook_data,
+                            high_impact=False, thread_key=job_name)
     
     def send_job_failure_notification(self, job_name: str,
                                     recipients: List[str],
@@ -219,41 +824,27 @@ Status: SUCCESS
         
         # Build message
         details = job_details or {}
-        message = f"""
-ETL Job '{job_name}' FAILED.
-
-Error Message:
-{error_message}
-
-Job Details:
-- Start Time: {details.get('start_time', 'Unknown')}
-- Failure Time: {details.get('failure_time', 'Unknown')}
-- Duration: {details.get('duration', 'Unknown')}
-- Rows Processed: {details.get('rows_processed', 'Unknown')}
-
-Status: FAILED
-
-Please check the logs for more details.
-        """.strip()
-        
-        # Send email
-        email_success = self.send_email(recipients, subject, message)
-        
-        # Send Slack notification
-        slack_message = f"❌ ETL Job FAILED: {job_name} - {error_message}"
-        slack_success = self.send_slack_notification(slack_message)
-        
-        # Send webhook
-        webhook_data = {
-            'event_type': 'job_failure',
-            'job_name': job_name,
-            'timestamp': datetime.now().isoformat(),
-            'error_message': error_message,
-            'details': details
-        }
-        webhook_success = self.send_webhook_notification(webhook_data)
-        
-        return email_success and slack_success and webhook_success
+        message = _JOB_FAILURE_TEMPLATE.format_map(
+            ChainMap({'job_name': job_name, 'error_message': error_message},
+                     details, _JOB_DETAIL_DEFAULTS)
+        )
+        
+        slack_message = None
+        if self.slack_webhook_url:
+            slack_message = f"❌ ETL Job FAILED: {job_name} - {error_message}"
+        
+        webhook_data = None
+        if self.webhook_urls:
+            webhook_data = {
+                'event_type': 'job_failure',
+                'job_name': job_name,
+                'timestamp': datetime.now().isoformat(),
+                'error_message': error_message,
+                'details': details
+            }
+        
+        return self._fan_out(recipients, subject, message, slack_message, webhook_data,
+                            high_impact=True, thread_key=job_name)
     
     def send_error_notification(self, subject: str, message: str, 
                               error_details: Optional[Dict] = None) -> bool:
@@ -274,23 +865,21 @@ Please check the logs for more details.
         # Build detailed message
         detailed_message = message
         if error_details:
-            detailed_message += f"\n\nError Details:\n{json.dumps(error_details, indent=2)}"
-        
-        # Send email
-        email_success = self.send_email(admin_emails, subject, detailed_message)
-        
-        # Send Slack notification
-        slack_message = f"🚨 {subject}: {message}"
-        slack_success = self.send_slack_notification(slack_message)
-        
-        # Send webhook
-        webhook_data = {
-            'event_type': 'error',
-            'subject': subject,
-            'message': message,
-            'timestamp': datetime.now().isoformat(),
-            'error_details': error_details
-        }
-        webhook_success = self.send_webhook_notification(webhook_data)
-        
-        return email_success and slack_success and webhook_success
\ No newline at end of file
+            detailed_message += f"\n\nError Details:\n{_json_bytes(error_details, indent=True).decode()}"
+        
+        slack_message = None
+        if self.slack_webhook_url:
+            slack_message = f"🚨 {subject}: {message}"
+        
+        webhook_data = None
+        if self.webhook_urls:
+            webhook_data = {
+                'event_type': 'error',
+                'subject': subject,
+                'message': message,
+                'timestamp': datetime.now().isoformat(),
+                'error_details': error_details
+            }
+        
+        return self._fan_out(admin_emails, subject, detailed_message, slack_message, webhook_data,
+                            high_impact=True)
\ No newline at end of file
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.util.config_manager import ConfigManager
+
+DATABASE_CONFIGS = """\
+default_oracle_config:
+  port: ${ETL_TEST_PORT}
+  schema: ${ETL_TEST_SCHEMA}
+  options: {timeout: "${ETL_TEST_TIMEOUT}"}
+oracle_databases:
+  source:
+    host: db1
+    username: etl
+    password: ${ETL_TEST_PASSWORD}
+    schema: own
+  target:
+    host: db2
+    username: etl
+    password: plain
+"""
+
+
+class ConfigManagerEnvTest(unittest.TestCase):
+    """Environment references resolve from precompiled paths without touching loaded configs."""
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.config_dir = Path(tmp.name)
+        (self.config_dir / 'database_configs.yml').write_text(DATABASE_CONFIGS)
+        
+        env = mock.patch.dict(os.environ, {
+            'ETL_TEST_PORT': '1522', 'ETL_TEST_SCHEMA': 'shared',
+            'ETL_TEST_TIMEOUT': '30', 'ETL_TEST_PASSWORD': 'secret'
+        })
+        env.start()
+        self.addCleanup(env.stop)
+    
+    def test_own_and_default_references_resolve(self):
+        manager = ConfigManager(self.config_dir)
+        
+        source = manager.get_database_config('source')
+        self.assertEqual(source['password'], 'secret')
+        self.assertEqual(source['port'], '1522')
+        self.assertEqual(source['schema'], 'own')
+        self.assertEqual(source['options'], {'timeout': '30'})
+        
+        target = manager.get_database_config('target')
+        self.assertEqual(target['schema'], 'shared')
+        self.assertEqual(target['password'], 'plain')
+    
+    def test_loaded_config_keeps_its_references(self):
+        manager = ConfigManager(self.config_dir)
+        manager.get_database_config('source')
+        
+        loaded = manager.get_config('database')
+        self.assertEqual(loaded['oracle_databases']['source']['password'], '${ETL_TEST_PASSWORD}')
+        self.assertEqual(loaded['default_oracle_config']['options'], {'timeout': '${ETL_TEST_TIMEOUT}'})
+    
+    def test_managers_do_not_share_parsed_configs(self):
+        first = ConfigManager(self.config_dir)
+        first.get_config('database')['oracle_databases']['source']['host'] = 'changed'
+        
+        second = ConfigManager(self.config_dir)
+        self.assertEqual(second.get_database_config('source')['host'], 'db1')
+    
+    def test_updated_references_resolve(self):
+        manager = ConfigManager(self.config_dir)
+        manager.update_config('database', {
+            'oracle_databases': {'extra': {'host': 'db3', 'password': '${ETL_TEST_PASSWORD}'}}
+        })
+        self.assertEqual(manager.get_database_config('extra')['password'], 'secret')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from unittest import mock
+
+from src.util.notification_service import NotificationService, NotifyStatus
+
+
+def _service(**config) -> NotificationService:
+    """Build a service whose HTTP session is mocked to answer 200."""
+    service = NotificationService({
+        'slack_webhook_url': 'https://hooks.example/slack',
+        'webhook_urls': ['https://hooks.example/webhook'],
+        'http_max_retries': 0,
+        **config
+    })
+    service._http.close()
+    service._http = mock.Mock()
+    service._http.post.return_value = mock.Mock(status_code=200, headers={})
+    return service
+
+
+class NotificationDedupTest(unittest.TestCase):
+    """Content dedup suppresses repeats within the TTL only."""
+    
+    def setUp(self):
+        self.service = _service()
+        self.addCleanup(self.service.close)
+    
+    def test_repeat_within_ttl_is_skipped(self):
+        self.assertEqual(self.service.send_slack_notification('boom'), NotifyStatus.SENT)
+        self.assertEqual(self.service.send_slack_notification('boom'), NotifyStatus.SKIPPED)
+        self.assertEqual(self.service._http.post.call_count, 1)
+    
+    def test_repeat_after_ttl_is_sent(self):
+        with mock.patch('src.util.notification_service.time.monotonic', return_value=1000.0):
+            self.service.send_slack_notification('boom')
+        with mock.patch('src.util.notification_service.time.monotonic',
+                        return_value=1000.0 + self.service._dedup_ttl + 1):
+            self.assertEqual(self.service.send_slack_notification('boom'), NotifyStatus.SENT)
+        self.assertEqual(self.service._http.post.call_count, 2)
+    
+    def test_default_ttl_does_not_span_hourly_runs(self):
+        self.assertLess(self.service._dedup_ttl, 3600)
+    
+    def test_webhook_dedup_ignores_timestamp(self):
+        first = {'event_type': 'job_failure', 'timestamp': '2024-01-01T00:00:00'}
+        second = {'event_type': 'job_failure', 'timestamp': '2024-01-01T00:00:01'}
+        self.assertEqual(self.service.send_webhook_notification(first), NotifyStatus.SENT)
+        self.assertEqual(self.service.send_webhook_notification(second), NotifyStatus.SKIPPED)
+    
+    def test_failed_send_is_not_remembered(self):
+        self.service._http.post.return_value = mock.Mock(status_code=400, headers={})
+        self.assertEqual(self.service.send_slack_notification('boom'), NotifyStatus.FAILED)
+        
+        self.service._http.post.return_value = mock.Mock(status_code=200, headers={})
+        self.assertEqual(self.service.send_slack_notification('boom'), NotifyStatus.SENT)
+    
+    def test_disabled_dedup_sends_every_time(self):
+        service = _service(dedup_ttl_seconds=0)
+        self.addCleanup(service.close)
+        service.send_slack_notification('boom')
+        self.assertEqual(service.send_slack_notification('boom'), NotifyStatus.SENT)
+
+
+class NotificationRateLimitTest(unittest.TestCase):
+    """Low-priority pushes are rate limited; high-impact pushes are not."""
+    
+    def setUp(self):
+        self.service = _service(push_rate_limit=2, dedup_ttl_seconds=0)
+        self.addCleanup(self.service.close)
+    
+    def test_low_impact_pushes_are_capped_per_minute(self):
+        sent = [self.service.send_slack_notification(f'm{i}', high_impact=False) for i in range(3)]
+        self.assertEqual(sent, [NotifyStatus.SENT, NotifyStatus.SENT, NotifyStatus.SKIPPED])
+    
+    def test_high_impact_pushes_bypass_the_limit(self):
+        for i in range(3):
+            self.service.send_slack_notification(f'm{i}', high_impact=False)
+        self.assertEqual(self.service.send_slack_notification('alert'), NotifyStatus.SENT)
+    
+    def test_thread_key_window_is_per_channel(self):
+        self.assertEqual(
+            self.service.send_slack_notification('ok', high_impact=False, thread_key='job'),
+            NotifyStatus.SENT
+        )
+        self.assertEqual(
+            self.service.send_slack_notification('ok again', high_impact=False, thread_key='job'),
+            NotifyStatus.SKIPPED
+        )
+        self.assertEqual(
+            self.service.send_webhook_notification({'job': 'job'}, high_impact=False, thread_key='job'),
+            NotifyStatus.SENT
+        )
+
+
+class NotifyStatusTest(unittest.TestCase):
+    """Each channel reports SENT, SKIPPED or FAILED."""
+    
+    def test_unconfigured_channels_are_skipped(self):
+        service = NotificationService({})
+        self.addCleanup(service.close)
+        self.assertEqual(service.send_slack_notification('x'), NotifyStatus.SKIPPED)
+        self.assertEqual(service.send_webhook_notification({'x': 1}), NotifyStatus.SKIPPED)
+    
+    def test_server_error_is_failed(self):
+        service = _service()
+        self.addCleanup(service.close)
+        service._http.post.return_value = mock.Mock(status_code=500, headers={})
+        self.assertEqual(service.send_webhook_notification({'x': 1}), NotifyStatus.FAILED)
+        self.assertFalse(NotifyStatus.FAILED)
+    
+    def test_fan_out_fails_only_when_a_channel_failed(self):
+        service = _service()
+        self.addCleanup(service.close)
+        
+        with mock.patch.object(service, 'send_email', return_value=NotifyStatus.SKIPPED):
+            self.assertTrue(service.send_job_failure_notification('nightly', ['a@b'], 'ORA-01555'))
+            self.assertEqual(service._http.post.call_count, 2)
+            
+            service._http.post.return_value = mock.Mock(status_code=500, headers={})
+            self.assertFalse(service.send_job_failure_notification('other', ['a@b'], 'ORA-00060'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from unittest import mock
+
+from src.extractor.oracle_extractor import BatchResult, OracleDBManager
+
+
+class ExecuteBatchTest(unittest.TestCase):
+    """execute_batch against a mocked session pool."""
+    
+    def setUp(self):
+        self.manager = OracleDBManager('etl', 'pw', 'db/svc')
+        self.manager._pool = mock.MagicMock()
+        self.connection = self.manager._pool.acquire.return_value
+        self.cursor = self.connection.cursor.return_value
+        self.cursor.rowcount = 3
+    
+    def test_plain_batch_returns_rowcount(self):
+        self.assertEqual(self.manager.execute_batch('BEGIN p(:1); END;', [(1,), (2,), (3,)]), 3)
+        
+        _, kwargs = self.cursor.executemany.call_args
+        self.assertFalse(kwargs['arraydmlrowcounts'])
+        self.assertFalse(kwargs['batcherrors'])
+        self.cursor.getarraydmlrowcounts.assert_not_called()
+        self.connection.commit.assert_called_once()
+    
+    def test_batch_errors_are_returned(self):
+        error = mock.Mock(offset=1, message='ORA-00001')
+        self.cursor.getbatcherrors.return_value = [error]
+        
+        result = self.manager.execute_batch('INSERT INTO t VALUES (:1)', [(1,), (1,), (2,)],
+                                            batch_errors=True)
+        
+        self.assertEqual(result, BatchResult(rowcount=3, row_counts=None, errors=[error]))
+        self.connection.commit.assert_called_once()
+    
+    def test_row_counts_are_returned_when_requested(self):
+        self.cursor.getarraydmlrowcounts.return_value = [1, 2, 0]
+        
+        result = self.manager.execute_batch('UPDATE t SET x = :1', [(1,), (2,), (3,)],
+                                            row_counts=True)
+        
+        self.assertEqual(result.row_counts, [1, 2, 0])
+        self.assertEqual(result.errors, [])
+        _, kwargs = self.cursor.executemany.call_args
+        self.assertTrue(kwargs['arraydmlrowcounts'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import importlib
+import unittest
+from unittest import mock
+
+# Every module of the framework, so a broken import fails loudly
+MODULES = [
+    'src.exception',
+    'src.core.base_extractor',
+    'src.core.connection_manager',
+    'src.extractor.oracle_extractor',
+    'src.handler.exception_handler',
+    'src.util.async_notification_service',
+    'src.util.config_manager',
+    'src.util.encryption_util',
+    'src.util.logger',
+    'src.util.notification_service',
+]
+
+
+class ImportSmokeTest(unittest.TestCase):
+    """Import each module and exercise the connection manager without a database."""
+    
+    def test_modules_import(self):
+        for name in MODULES:
+            with self.subTest(module=name):
+                importlib.import_module(name)
+    
+    def test_connection_manager_helpers(self):
+        from src.core.connection_manager import ConnectionManager
+        
+        manager = ConnectionManager()
+        config = {
+            'host': 'db', 'port': 1521, 'service_name': 'svc', 'username': 'etl',
+            'timezone': 'UTC', 'nls_parameters': {'NLS_DATE_FORMAT': 'YYYY-MM-DD'}
+        }
+        
+        self.assertEqual(manager._pool_name(config), 'etl@db:1521/svc')
+        self.assertIn('svc', manager._resolve_dsn(config))
+        
+        session_sql = manager._session_setup_sql(config)
+        self.assertTrue(session_sql.startswith('BEGIN '))
+        self.assertIn("TIME_ZONE = 'UTC'", session_sql)
+        self.assertIsNone(manager._session_setup_sql({}))
+        
+        manager.close_all()
+    
+    def test_execute_ddl_closes_its_cursor(self):
+        from src.core.connection_manager import ConnectionManager
+        
+        connection = mock.MagicMock()
+        self.assertTrue(ConnectionManager().execute_ddl(connection, 'CREATE TABLE t (x NUMBER)'))
+        
+        cursor = connection.cursor.return_value
+        cursor.execute.assert_called_once_with('CREATE TABLE t (x NUMBER)')
+        cursor.close.assert_called_once()
+        connection.commit.assert_called_once()
+    
+    def test_sqlalchemy_engine_is_cached_per_url(self):
+        from src.core import connection_manager
+        
+        manager = connection_manager.ConnectionManager()
+        config = {'host': 'db', 'service_name': 'svc', 'username': 'etl', 'password': 'pw'}
+        
+        with mock.patch.object(connection_manager, 'create_engine') as create_engine:
+            first = manager.create_sqlalchemy_engine(config)
+            second = manager.create_sqlalchemy_engine(config)
+        
+        self.assertIs(first, second)
+        create_engine.assert_called_once()
+        
+        manager.close_all()
+        first.dispose.assert_called_once()
+
+    
+    def test_named_connections_share_one_pool_per_dsn(self):
+        from src.core import connection_manager
+        
+        manager = connection_manager.ConnectionManager()
+        config = {'host': 'db', 'service_name': 'svc', 'username': 'etl', 'password': 'pw'}
+        
+        with mock.patch.object(connection_manager.oracledb, 'create_pool') as create_pool:
+            pool = create_pool.return_value
+            pool.acquire.side_effect = lambda: mock.MagicMock()
+            
+            first = manager.get_connection('extract', config)
+            second = manager.get_connection('load', config)
+            manager.test_connection(config, retry_count=1)
+        
+        create_pool.assert_called_once()
+        self.assertIsNot(first, second)
+        
+        manager.release(first)
+        pool.release.assert_called_once_with(first)
+        
+        manager.close_pool(manager._pool_name(config))
+        pool.release.assert_called_with(second)
+        pool.close.assert_called_once()
+        self.assertEqual(manager._connections, {})
+
+    
+    def test_connection_info_is_queried_per_session(self):
+        from src.core.connection_manager import ConnectionManager
+        
+        manager = ConnectionManager()
+        sessions = []
+        for instance in ('orcl1', 'orcl2'):
+            connection = mock.MagicMock(dsn='db/svc', username='etl')
+            connection.cursor.return_value.fetchone.return_value = (
+                'Oracle 19c', instance, 'node', 'ETL', 'node', 'ORCL'
+            )
+            sessions.append(connection)
+        
+        self.assertEqual(
+            [manager.get_connection_info(c)['instance_name'] for c in sessions],
+            ['orcl1', 'orcl2']
+        )
+
+    
+    def test_extraction_stats_view(self):
+        from src.core.base_extractor import BaseExtractor
+        
+        class Extractor(BaseExtractor):
+            __slots__ = ()
+            test_connection = extract_table = extract_query = lambda self, *a, **k: None
+            get_table_metadata = list_tables = close = lambda self, *a, **k: None
+        
+        extractor = Extractor({'host': 'db', 'username': 'etl', 'password': 'pw'})
+        extractor.start_extraction()
+        extractor.add_extraction_stats(10)
+        extractor.add_error('boom')
+        extractor.end_extraction()
+        
+        stats = extractor.extraction_stats
+        self.assertEqual(stats['rows_extracted'], 10)
+        self.assertEqual(stats['tables_processed'], 1)
+        self.assertEqual([e['error'] for e in stats['errors']], ['boom'])
+        self.assertIsNotNone(stats['end_time'])
+        with self.assertRaises(AttributeError):
+            extractor.extraction_stats = {}
+
+
+if __name__ == '__main__':
+    unittest.main()